@@ -7,25 +7,112 @@ Measures performance metrics for vector operations at different scales:
 - Memory usage
 - Index size
 
+Transports:
+- rest: POST JSON batches to the API's /upsert endpoint (default)
+- grpc: upsert straight into Qdrant via AsyncQdrantClient over gRPC
+
 Usage:
     uv run python scripts/benchmark.py
+    uv run python scripts/benchmark.py --transport grpc
 """
 
+import argparse
+import asyncio
+import base64
+import math
+import os
 import time
-import statistics
 import sys
+from dataclasses import dataclass, field
 import numpy as np
 import httpx
-from typing import List, Dict, Any
+import orjson
+from typing import Awaitable, Callable, List, Dict, Any, Optional
+from qdrant_client import AsyncQdrantClient, models
+
+try:
+    from numba import njit, prange
+except ImportError:  # Optional: uv sync --group benchmark
+    njit = None
+
+try:
+    from tdigest import TDigest
+except ImportError:  # Optional: uv sync --group benchmark (needed for --long-run)
+    TDigest = None
 
 # Configuration
 API_URL = "http://localhost:8000"
+QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
+COLLECTION_NAME = "ai_memory"
 VECTOR_DIM = 384
 SCALES = [1_000, 10_000, 100_000]
+UPSERT_CONCURRENCY = 16  # Max in-flight upsert batches
+BATCH_SIZES = [100, 500, 1000]  # Upsert batch sweep (API caps requests at 1000)
+QUERY_ITERATIONS = 100
+QUERY_CONCURRENCY_LEVELS = [1, 5, 10, 20, 50]  # Throughput-under-load sweep
+CONCURRENT_QUERY_REQUESTS = 500  # Requests per concurrency level
+PROGRESS_INTERVAL = 0.5  # Min seconds between progress bar redraws
+SHOW_PROGRESS = True  # Cleared by --no-progress
+PERCENTILES = {"p50_ms": 50, "p90_ms": 90, "p95_ms": 95, "p99_ms": 99, "p999_ms": 99.9}
+
+# orjson serializes numpy arrays natively, so vectors never become Python floats
+JSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+@dataclass
+class BenchmarkOptions:
+    """Command-line tunables shared by every scale."""
+
+    transport: str = "rest"
+    batch_sizes: List[int] = field(default_factory=lambda: list(BATCH_SIZES))
+    query_iterations: int = QUERY_ITERATIONS
+    long_run: bool = False
+    fp16: bool = False
+    query_concurrency: List[int] = field(
+        default_factory=lambda: list(QUERY_CONCURRENCY_LEVELS)
+    )
+
+
+@dataclass
+class VectorBatch:
+    """
+    Benchmark dataset in structure-of-arrays form.
+
+    Vectors stay in one float32 array; per-point records are only built for
+    a slice at send time, so the full dataset never exists as Python floats.
+    """
+
+    ids: np.ndarray
+    vectors: np.ndarray
+    payloads: List[Dict[str, Any]]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: slice) -> "VectorBatch":
+        return VectorBatch(self.ids[index], self.vectors[index], self.payloads[index])
+
+
+_last_progress = 0.0
 
 
 def print_progress(current: int, total: int, prefix: str = "", suffix: str = ""):
-    """Print progress bar to terminal."""
+    """
+    Print progress bar to terminal.
+
+    Called from inside timed loops, so redraws are throttled to one per
+    PROGRESS_INTERVAL (the final update always prints) and skipped entirely
+    when SHOW_PROGRESS is off.
+    """
+    global _last_progress
+    if not SHOW_PROGRESS:
+        return
+    now = time.monotonic()
+    if current < total and now - _last_progress < PROGRESS_INTERVAL:
+        return
+    _last_progress = now
+
     bar_length = 40
     filled = int(bar_length * current / total)
     bar = "█" * filled + "░" * (bar_length - filled)
@@ -36,172 +123,533 @@ def print_progress(current: int, total: int, prefix: str = "", suffix: str = "")
         print()  # New line when complete
 
 
-def generate_vectors(count: int, dim: int = VECTOR_DIM) -> List[Dict[str, Any]]:
-    """Generate random normalized vectors."""
-    print(f"📊 Generating {count:,} random {dim}-dimensional vectors...")
-    vectors = np.random.randn(count, dim).astype(np.float32)
-    vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+def _l2_normalize_numpy(vectors: np.ndarray) -> None:
+    """L2-normalize rows in place (einsum fuses square+sum, no N x dim temp)."""
+    norms = np.einsum("ij,ij->i", vectors, vectors, optimize=True)
+    np.sqrt(norms, out=norms)
+    np.reciprocal(norms, out=norms)
+    vectors *= norms[:, None]
 
-    return [
-        {
-            "id": i,  # Use integer IDs (Qdrant accepts unsigned integers)
-            "vector": vectors[i].tolist(),
-            "payload": {"index": i, "batch": i // 1000},
-        }
-        for i in range(count)
-    ]
 
+def _l2_normalize_rows(vectors: np.ndarray) -> None:
+    """L2-normalize rows in place with one fused pass per row (Numba kernel)."""
+    for i in prange(vectors.shape[0]):
+        sum_sq = 0.0
+        for j in range(vectors.shape[1]):
+            sum_sq += vectors[i, j] * vectors[i, j]
+        inv_norm = 1.0 / math.sqrt(sum_sq)
+        for j in range(vectors.shape[1]):
+            vectors[i, j] *= inv_norm
 
-def benchmark_upsert(
-    client: httpx.Client, vectors: List[Dict], batch_size: int = 100
-) -> Dict[str, float]:
-    """Measure upsert throughput."""
-    total_vectors = len(vectors)
-    total_batches = (total_vectors + batch_size - 1) // batch_size
-    print(f"⬆️  Upserting {total_vectors:,} vectors in {total_batches} batches...")
 
-    start_time = time.perf_counter()
+# Multi-core JIT kernel when Numba is installed, single-threaded NumPy otherwise
+if njit is not None:
+    l2_normalize_inplace = njit(parallel=True, fastmath=True, cache=True)(
+        _l2_normalize_rows
+    )
+else:
+    l2_normalize_inplace = _l2_normalize_numpy
+
 
-    # Batch upsert with progress
-    for batch_num, i in enumerate(range(0, total_vectors, batch_size), 1):
-        batch = vectors[i : i + batch_size]
-        response = client.post(
-            f"{API_URL}/upsert", json={"points": batch}, timeout=30.0
+def generate_vectors(count: int, dim: int = VECTOR_DIM) -> VectorBatch:
+    """Generate random normalized vectors."""
+    print(f"📊 Generating {count:,} random {dim}-dimensional vectors...")
+    rng = np.random.default_rng()
+    vectors = rng.standard_normal((count, dim), dtype=np.float32)
+    l2_normalize_inplace(vectors)
+
+    # Use integer IDs (Qdrant accepts unsigned integers)
+    ids = np.arange(count, dtype=np.uint64)
+    payloads = [{"index": i, "batch": i // 1000} for i in range(count)]
+
+    return VectorBatch(ids, vectors, payloads)
+
+
+BatchSender = Callable[[VectorBatch], Awaitable[None]]
+
+
+def rest_sender(client: httpx.AsyncClient, fp16: bool = False) -> BatchSender:
+    """
+    Send batches as JSON to the API's /upsert endpoint.
+
+    With fp16, each vector goes out as base64-packed little-endian float16
+    (~1 KB per 384-dim vector instead of ~4.5 KB of JSON floats).
+    """
+
+    async def send(batch: VectorBatch) -> None:
+        if fp16:
+            vectors = [
+                base64.b64encode(row.tobytes()).decode()
+                for row in batch.vectors.astype("<f2")
+            ]
+        else:
+            # orjson writes float32 rows directly, skipping the .tolist() round-trip
+            vectors = batch.vectors
+        body = orjson.dumps(
+            {
+                "points": [
+                    {"id": point_id, "vector": vector, "payload": payload}
+                    for point_id, vector, payload in zip(
+                        batch.ids.tolist(), vectors, batch.payloads
+                    )
+                ]
+            },
+            option=JSON_OPTIONS,
+        )
+        response = await client.post(
+            f"{API_URL}/upsert",
+            content=body,
+            headers=JSON_HEADERS,
+            timeout=30.0,
         )
         response.raise_for_status()
 
-        # Update progress every 10 batches or at completion
-        if batch_num % 10 == 0 or batch_num == total_batches:
-            print_progress(
-                batch_num,
-                total_batches,
-                "   Uploading",
-                f"({batch_num}/{total_batches} batches)",
+    return send
+
+
+def binary_sender(client: httpx.AsyncClient) -> BatchSender:
+    """Send batches as packed ids + float32 vectors to /upsert_bin (no payloads)."""
+
+    async def send(batch: VectorBatch) -> None:
+        body = b"".join(
+            (
+                np.uint32(len(batch)).tobytes(),
+                batch.ids.astype("<u8", copy=False).tobytes(),
+                batch.vectors.astype("<f4", copy=False).tobytes(),
             )
+        )
+        response = await client.post(
+            f"{API_URL}/upsert_bin",
+            content=body,
+            headers={"content-type": "application/octet-stream"},
+            timeout=30.0,
+        )
+        response.raise_for_status()
+
+    return send
+
+
+def grpc_sender(qclient: AsyncQdrantClient) -> BatchSender:
+    """Send batches directly to Qdrant over gRPC (packed float32, no JSON)."""
+
+    async def send(batch: VectorBatch) -> None:
+        await qclient.upsert(
+            collection_name=COLLECTION_NAME,
+            points=models.Batch(
+                ids=batch.ids.tolist(),
+                vectors=batch.vectors.tolist(),
+                payloads=batch.payloads,
+            ),
+        )
+
+    return send
+
+
+async def benchmark_upsert(
+    send_batch: BatchSender,
+    data: VectorBatch,
+    batch_size: int = 100,
+    concurrency: int = UPSERT_CONCURRENCY,
+) -> Dict[str, float]:
+    """Measure upsert throughput with up to `concurrency` batches in flight."""
+    total_vectors = len(data)
+    total_batches = (total_vectors + batch_size - 1) // batch_size
+    print(
+        f"⬆️  Upserting {total_vectors:,} vectors in {total_batches} batches "
+        f"({concurrency} in flight)..."
+    )
 
+    semaphore = asyncio.Semaphore(concurrency)
+    completed = 0
+
+    async def bounded_send(start: int) -> None:
+        nonlocal completed
+        async with semaphore:
+            await send_batch(data[start : start + batch_size])
+        completed += 1
+        print_progress(
+            completed,
+            total_batches,
+            "   Uploading",
+            f"({completed}/{total_batches} batches)",
+        )
+
+    start_time = time.perf_counter()
+    await asyncio.gather(
+        *(bounded_send(start) for start in range(0, total_vectors, batch_size))
+    )
     elapsed = time.perf_counter() - start_time
     throughput = total_vectors / elapsed
 
     return {
         "total_vectors": total_vectors,
+        "batch_size": batch_size,
+        "concurrency": concurrency,
         "elapsed_seconds": round(elapsed, 2),
         "throughput_vectors_per_sec": round(throughput, 2),
     }
 
 
-def benchmark_query(
-    client: httpx.Client, query_vector: List[float], iterations: int = 100
+async def benchmark_query(
+    client: httpx.AsyncClient,
+    query_vector: np.ndarray,
+    iterations: int = QUERY_ITERATIONS,
+    long_run: bool = False,
 ) -> Dict[str, float]:
-    """Measure query latency percentiles."""
-    print(f"🔍 Running {iterations} query iterations...")
-    latencies = []
+    """
+    Measure query latency percentiles (serial, one request at a time).
+
+    Percentiles are linearly interpolated with np.percentile. With long_run,
+    latencies stream into a t-digest instead, keeping memory constant for
+    million-iteration runs.
+    """
+    print(f"🔍 Running {iterations:,} query iterations...")
+    if long_run and TDigest is None:
+        raise RuntimeError("--long-run requires tdigest: uv sync --group benchmark")
+
+    digest = TDigest() if long_run else None
+    # Raw perf_counter_ns deltas; converted to ms once after the loop
+    latencies_ns = None if long_run else np.empty(iterations, dtype=np.int64)
+    total_ms, min_ms, max_ms = 0.0, float("inf"), 0.0
+
+    # The request body is identical every iteration, so serialize it once
+    body = orjson.dumps({"vector": query_vector, "limit": 10}, option=JSON_OPTIONS)
 
     for i in range(iterations):
-        start = time.perf_counter()
-        response = client.post(
-            f"{API_URL}/query", json={"vector": query_vector, "limit": 10}, timeout=10.0
+        start = time.perf_counter_ns()
+        response = await client.post(
+            f"{API_URL}/query", content=body, headers=JSON_HEADERS, timeout=10.0
         )
+        elapsed_ns = time.perf_counter_ns() - start
         response.raise_for_status()
-        latencies.append((time.perf_counter() - start) * 1000)  # Convert to ms
 
-        # Show progress every 20 queries
-        if (i + 1) % 20 == 0 or (i + 1) == iterations:
-            print_progress(
-                i + 1, iterations, "   Querying", f"({i + 1}/{iterations} queries)"
-            )
+        if digest is not None:
+            latency_ms = elapsed_ns / 1e6
+            digest.update(latency_ms)
+            total_ms += latency_ms
+            min_ms = min(min_ms, latency_ms)
+            max_ms = max(max_ms, latency_ms)
+        else:
+            latencies_ns[i] = elapsed_ns
+
+        print_progress(
+            i + 1, iterations, "   Querying", f"({i + 1}/{iterations} queries)"
+        )
 
-    latencies.sort()
+    if digest is not None:
+        values = [digest.percentile(q) for q in PERCENTILES.values()]
+        mean_ms = total_ms / iterations
+    else:
+        latencies = latencies_ns / 1e6
+        values = np.percentile(latencies, list(PERCENTILES.values())).tolist()
+        mean_ms, min_ms, max_ms = latencies.mean(), latencies.min(), latencies.max()
 
     return {
         "iterations": iterations,
-        "p50_ms": round(statistics.median(latencies), 2),
-        "p95_ms": round(latencies[int(0.95 * len(latencies))], 2),
-        "p99_ms": round(latencies[int(0.99 * len(latencies))], 2),
-        "mean_ms": round(statistics.mean(latencies), 2),
-        "min_ms": round(min(latencies), 2),
-        "max_ms": round(max(latencies), 2),
+        **{key: round(value, 2) for key, value in zip(PERCENTILES, values)},
+        "mean_ms": round(float(mean_ms), 2),
+        "min_ms": round(float(min_ms), 2),
+        "max_ms": round(float(max_ms), 2),
+    }
+
+
+async def benchmark_query_concurrent(
+    client: httpx.AsyncClient,
+    query_vector: np.ndarray,
+    total_requests: int = CONCURRENT_QUERY_REQUESTS,
+    concurrency: int = 10,
+) -> Dict[str, float]:
+    """Measure query throughput (QPS) and per-request latency under concurrent load."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies_ns = np.empty(total_requests, dtype=np.int64)
+    body = orjson.dumps({"vector": query_vector, "limit": 10}, option=JSON_OPTIONS)
+
+    async def timed_query(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter_ns()
+            response = await client.post(
+                f"{API_URL}/query", content=body, headers=JSON_HEADERS, timeout=10.0
+            )
+            latencies_ns[i] = time.perf_counter_ns() - start
+        response.raise_for_status()
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(timed_query(i) for i in range(total_requests)))
+    elapsed = time.perf_counter() - start_time
+
+    p50, p95, p99 = np.percentile(latencies_ns / 1e6, [50, 95, 99]).tolist()
+    return {
+        "concurrency": concurrency,
+        "total_requests": total_requests,
+        "elapsed_seconds": round(elapsed, 2),
+        "qps": round(total_requests / elapsed, 2),
+        "p50_ms": round(p50, 2),
+        "p95_ms": round(p95, 2),
+        "p99_ms": round(p99, 2),
     }
 
 
-def get_collection_info(client: httpx.Client) -> Dict[str, Any]:
+async def get_collection_info(client: httpx.AsyncClient) -> Dict[str, Any]:
     """Get collection statistics."""
-    response = client.get(f"{API_URL}/collections", timeout=10.0)
+    response = await client.get(f"{API_URL}/collections", timeout=10.0)
     response.raise_for_status()
     data = response.json()
 
     for collection in data["collections"]:
-        if collection["name"] == "ai_memory":
+        if collection["name"] == COLLECTION_NAME:
             return collection
 
-    return {"name": "ai_memory", "vectors_count": 0}
+    return {"name": COLLECTION_NAME, "vectors_count": 0}
 
 
-def run_benchmark(scale: int) -> Dict[str, Any]:
-    """Run complete benchmark for given scale."""
+def make_client() -> httpx.AsyncClient:
+    """
+    Create an async client with enough pooled connections for pipelining.
+
+    The pool is sized well above the highest concurrency level so requests
+    never stall waiting on httpx's default 10 keep-alive connections. The
+    transport is built explicitly (limits and http2 live on it, not the
+    client) with retries disabled so failures surface instead of skewing
+    timings. HTTP/2 needs h2 from the benchmark group (uv sync --group
+    benchmark).
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        retries=0,
+    )
+    return httpx.AsyncClient(
+        transport=transport, timeout=httpx.Timeout(30.0, connect=5.0)
+    )
+
+
+async def run_benchmark(
+    client: httpx.AsyncClient,
+    data: VectorBatch,
+    options: Optional[BenchmarkOptions] = None,
+) -> Dict[str, Any]:
+    """Run complete benchmark for a generated dataset using a shared client."""
+    if options is None:
+        options = BenchmarkOptions()
+    scale = len(data)
     print(f"\n{'=' * 60}")
     print(f"📈 Benchmarking at scale: {scale:,} vectors")
     print(f"{'=' * 60}")
 
-    with httpx.Client() as client:
-        # Generate test data
-        vectors = generate_vectors(scale)
-        print("   ✓ Vectors generated\n")
+    # Benchmark upsert at each batch size (same IDs, so reruns overwrite)
+    qclient = (
+        AsyncQdrantClient(url=QDRANT_URL, prefer_grpc=True)
+        if options.transport == "grpc"
+        else None
+    )
+    if qclient:
+        send_batch = grpc_sender(qclient)
+    elif options.transport == "binary":
+        send_batch = binary_sender(client)
+    else:
+        send_batch = rest_sender(client)
+    upsert_sweep = []
+    try:
+        for batch_size in options.batch_sizes:
+            result = await benchmark_upsert(send_batch, data, batch_size=batch_size)
+            result["transport"] = options.transport
+            result["vector_encoding"] = "fp32"
+            upsert_sweep.append(result)
+            print(
+                f"   ✓ batch_size={batch_size}: "
+                f"{result['throughput_vectors_per_sec']:,.0f} vectors/sec "
+                f"({result['elapsed_seconds']}s)"
+            )
+    finally:
+        if qclient:
+            await qclient.close()
+
+    upsert_results = max(upsert_sweep, key=lambda r: r["throughput_vectors_per_sec"])
+    print(
+        f"   ✓ Best batch size: {upsert_results['batch_size']} "
+        f"({upsert_results['throughput_vectors_per_sec']:,.0f} vectors/sec)\n"
+    )
 
-        # Benchmark upsert
-        upsert_results = benchmark_upsert(client, vectors)
+    # Same upsert at the best batch size with fp16 base64 vectors, for comparison
+    upsert_fp16 = None
+    if options.fp16:
+        upsert_fp16 = await benchmark_upsert(
+            rest_sender(client, fp16=True),
+            data,
+            batch_size=upsert_results["batch_size"],
+        )
+        upsert_fp16.update(transport="rest", vector_encoding="fp16-base64")
         print(
-            f"   ✓ Throughput: {upsert_results['throughput_vectors_per_sec']:,.0f} vectors/sec"
+            f"   ✓ fp16 base64: "
+            f"{upsert_fp16['throughput_vectors_per_sec']:,.0f} vectors/sec "
+            f"({upsert_fp16['elapsed_seconds']}s)\n"
         )
-        print(f"   ✓ Time: {upsert_results['elapsed_seconds']}s\n")
 
-        # Benchmark query
-        query_vector = vectors[0]["vector"]  # Use first vector
-        query_results = benchmark_query(client, query_vector)
+    # Benchmark query
+    query_vector = data.vectors[0]  # Use first vector
+    query_results = await benchmark_query(
+        client, query_vector, options.query_iterations, options.long_run
+    )
+    print(
+        f"   ✓ p50: {query_results['p50_ms']}ms | p95: {query_results['p95_ms']}ms | "
+        f"p99: {query_results['p99_ms']}ms | p99.9: {query_results['p999_ms']}ms\n"
+    )
+
+    # Benchmark query throughput under concurrent load
+    print(f"🔁 Query throughput at concurrency {options.query_concurrency}...")
+    print(
+        f"   {'Concurrency':<13} {'QPS':<10} {'p50 (ms)':<10} "
+        f"{'p95 (ms)':<10} {'p99 (ms)':<10}"
+    )
+    query_load = []
+    for concurrency in options.query_concurrency:
+        load = await benchmark_query_concurrent(
+            client, query_vector, concurrency=concurrency
+        )
+        query_load.append(load)
         print(
-            f"   ✓ p50: {query_results['p50_ms']}ms | p95: {query_results['p95_ms']}ms | p99: {query_results['p99_ms']}ms\n"
+            f"   {concurrency:<13} {load['qps']:<10,.0f} {load['p50_ms']:<10} "
+            f"{load['p95_ms']:<10} {load['p99_ms']:<10}"
         )
+    print()
 
-        # Get collection stats
-        print("📊 Fetching collection statistics...")
-        collection_info = get_collection_info(client)
-        print(f"   ✓ Total vectors in collection: {collection_info['vectors_count']:,}")
+    # Get collection stats
+    print("📊 Fetching collection statistics...")
+    collection_info = await get_collection_info(client)
+    print(f"   ✓ Total vectors in collection: {collection_info['vectors_count']:,}")
 
     return {
         "scale": scale,
         "upsert": upsert_results,
+        "upsert_sweep": upsert_sweep,
+        "upsert_fp16": upsert_fp16,
         "query": query_results,
+        "query_load": query_load,
         "collection": collection_info,
     }
 
 
+async def run_all(options: BenchmarkOptions, results: List[Dict[str, Any]]) -> None:
+    """
+    Benchmark every scale over one shared client, appending to `results`.
+
+    Each scale's vectors are generated before its timed phases start, never
+    alongside them: a background generator would compete for the same cores
+    as the API and Qdrant and skew throughput and latency.
+    """
+    async with make_client() as client:
+        for idx, scale in enumerate(SCALES, 1):
+            print(f"\n{'=' * 80}")
+            print(f"📋 Running benchmark {idx}/{len(SCALES)}")
+            print(f"{'=' * 80}")
+
+            data = generate_vectors(scale)
+            print(f"   ✓ {scale:,} vectors generated\n")
+
+            try:
+                results.append(await run_benchmark(client, data, options))
+            except Exception as e:
+                print(f"\n✗ Error at scale {scale:,}: {e}")
+                import traceback
+
+                traceback.print_exc()
+                break
+
+
 def print_summary_table(results: List[Dict[str, Any]]):
     """Print formatted summary table."""
     print(f"\n{'=' * 80}")
     print("BENCHMARK SUMMARY")
     print(f"{'=' * 80}")
     print(
-        f"{'Scale':<15} {'Upsert (vec/s)':<20} {'Query p95 (ms)':<20} {'Vectors Stored':<20}"
+        f"{'Scale':<12} {'Upsert (vec/s)':<17} {'Best Batch':<13} "
+        f"{'Query p95 (ms)':<17} {'Vectors Stored':<17}"
     )
     print(f"{'-' * 80}")
 
     for result in results:
         scale = f"{result['scale']:,}"
         throughput = f"{result['upsert']['throughput_vectors_per_sec']:,.0f}"
+        batch_size = f"{result['upsert']['batch_size']}"
         p95 = f"{result['query']['p95_ms']}"
         stored = f"{result['collection']['vectors_count']:,}"
 
-        print(f"{scale:<15} {throughput:<20} {p95:<20} {stored:<20}")
+        print(f"{scale:<12} {throughput:<17} {batch_size:<13} {p95:<17} {stored:<17}")
 
     print(f"{'=' * 80}\n")
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument(
+        "--transport",
+        choices=["rest", "binary", "grpc"],
+        default="rest",
+        help=(
+            "Upsert path: JSON via the API (rest), packed float32 via "
+            "/upsert_bin (binary) or direct to Qdrant (grpc)"
+        ),
+    )
+    parser.add_argument(
+        "--batch-sizes",
+        type=int,
+        nargs="+",
+        default=BATCH_SIZES,
+        help="Upsert batch sizes to sweep (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--query-iterations",
+        type=int,
+        default=QUERY_ITERATIONS,
+        help="Serial query requests per scale (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--long-run",
+        action="store_true",
+        help="Stream query latencies into a t-digest (constant memory)",
+    )
+    parser.add_argument(
+        "--fp16",
+        action="store_true",
+        help="Also upsert via REST with base64 float16 vectors and compare",
+    )
+    parser.add_argument(
+        "--no-progress",
+        action="store_true",
+        help="Disable progress bars (e.g. for CI logs)",
+    )
+    parser.add_argument(
+        "--query-concurrency",
+        type=int,
+        nargs="+",
+        default=QUERY_CONCURRENCY_LEVELS,
+        help="Concurrency levels for the query throughput sweep (default: %(default)s)",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Run benchmarks for all scales."""
+    global SHOW_PROGRESS
+    args = parse_args()
+    SHOW_PROGRESS = not args.no_progress
+    options = BenchmarkOptions(
+        transport=args.transport,
+        batch_sizes=args.batch_sizes,
+        query_iterations=args.query_iterations,
+        long_run=args.long_run,
+        fp16=args.fp16,
+        query_concurrency=args.query_concurrency,
+    )
+
     print("=" * 80)
     print("🚀 AI Memory System - Performance Benchmark")
     print("=" * 80)
     print(f"📡 API: {API_URL}")
     print(f"📏 Vector Dimension: {VECTOR_DIM}")
+    print(f"🔌 Upsert transport: {args.transport}")
+    print(f"📦 Batch sizes: {', '.join(map(str, args.batch_sizes))}")
     print(f"📊 Scales: {', '.join(f'{s:,}' for s in SCALES)} vectors\n")
 
     # Check API is running
@@ -215,24 +663,12 @@ def main():
         print("   💡 Please start the API: docker compose up -d")
         return
 
-    results = []
-
-    for idx, scale in enumerate(SCALES, 1):
-        print(f"\n{'=' * 80}")
-        print(f"📋 Running benchmark {idx}/{len(SCALES)}")
-        print(f"{'=' * 80}")
-        try:
-            result = run_benchmark(scale)
-            results.append(result)
-        except KeyboardInterrupt:
-            print("\n\n⚠️  Benchmark interrupted by user (Ctrl+C)")
-            break
-        except Exception as e:
-            print(f"\n✗ Error at scale {scale:,}: {e}")
-            import traceback
-
-            traceback.print_exc()
-            break
+    results: List[Dict[str, Any]] = []
+
+    try:
+        asyncio.run(run_all(options, results))
+    except KeyboardInterrupt:
+        print("\n\n⚠️  Benchmark interrupted by user (Ctrl+C)")
 
     if results:
         print_summary_table(results)
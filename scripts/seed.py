@@ -4,13 +4,61 @@ Embedding Generation Script
 Generates synthetic text embeddings for development and testing.
 Uses sentence-transformers to create normalized vector representations
 of AI/ML related documents for similarity search operations.
+
+The model runs on the ONNX Runtime backend with dynamic int8 quantization.
+The first run exports and quantizes it into data/models/; later runs load
+the saved ONNX files directly and skip the export. The int8 kernels target
+ONNX_QUANTIZATION (avx512_vnni, avx512, avx2 or arm64); by default arm64 on
+ARM machines and avx2, which any recent x86-64 CPU supports, elsewhere.
+Each target is saved under its own file name.
 """
 
 import json
+import os
+import platform
 from pathlib import Path
-from sentence_transformers import SentenceTransformer
+import numpy as np
+from sentence_transformers import (
+    SentenceTransformer,
+    export_dynamic_quantized_onnx_model,
+)
 from datetime import datetime, UTC
 
+MODEL_NAME = "all-MiniLM-L6-v2"
+MODEL_DIR = Path("data/models") / f"{MODEL_NAME}-onnx"
+QUANTIZATION = os.getenv(
+    "ONNX_QUANTIZATION",
+    "arm64" if platform.machine().lower() in ("arm64", "aarch64") else "avx2",
+)
+QUANTIZED_FILE = f"onnx/model_qint8_{QUANTIZATION}.onnx"
+OUTPUT_PATH = Path("data/seed_embeddings.npz")
+METADATA_PATH = OUTPUT_PATH.with_suffix(".metadata.json")
+
+
+def load_model() -> SentenceTransformer:
+    """
+    Load the quantized ONNX embedding model, exporting it on first use.
+
+    Returns:
+        SentenceTransformer backed by ONNX Runtime (CPUExecutionProvider)
+    """
+    if not (MODEL_DIR / QUANTIZED_FILE).exists():
+        print(f"Exporting {MODEL_NAME} to ONNX (first run only)...")
+        print("First run will download model files (~100MB)")
+        model = SentenceTransformer(MODEL_NAME, backend="onnx")
+        model.save_pretrained(str(MODEL_DIR))
+        export_dynamic_quantized_onnx_model(model, QUANTIZATION, str(MODEL_DIR))
+        print(f"Saved ONNX model to {MODEL_DIR}")
+
+    return SentenceTransformer(
+        str(MODEL_DIR),
+        backend="onnx",
+        model_kwargs={
+            "file_name": QUANTIZED_FILE,
+            "provider": "CPUExecutionProvider",
+        },
+    )
+
 
 def generate_embeddings(count: int = 1000) -> dict:
     """
@@ -18,7 +66,9 @@ def generate_embeddings(count: int = 1000) -> dict:
 
     Creates a diverse set of documents about AI/ML topics, converts them
     to vector embeddings using a pre-trained transformer model, and saves
-    the results to disk for use in development and testing.
+    the results to disk for use in development and testing: ids, float32
+    embeddings and texts go to a compressed .npz archive, with a small
+    metadata JSON sidecar alongside it.
 
     Args:
         count: Number of document embeddings to generate
@@ -30,10 +80,9 @@ def generate_embeddings(count: int = 1000) -> dict:
     print(f"Generating {count} embeddings")
     print(f"{'=' * 60}\n")
 
-    # Load pre-trained model (downloads ~100MB on first run)
-    print("Loading embedding model (all-MiniLM-L6-v2)...")
-    print("First run will download model files (~100MB)")
-    model = SentenceTransformer("all-MiniLM-L6-v2")
+    # Load quantized ONNX model (exported to data/models/ on first run)
+    print(f"Loading embedding model ({MODEL_NAME}, ONNX int8)...")
+    model = load_model()
     print("Model loaded\n")
 
     # Generate diverse synthetic documents
@@ -67,33 +116,35 @@ def generate_embeddings(count: int = 1000) -> dict:
     embeddings = model.encode(
         sentences,
         show_progress_bar=True,
-        batch_size=32,
+        batch_size=64,
         normalize_embeddings=True,  # L2 normalization for cosine similarity
     )
     print("Encoding complete\n")
 
-    # Package data with metadata
-    data = {
-        "metadata": {
-            "count": len(embeddings),
-            "dimensions": embeddings.shape[1],
-            "model": "all-MiniLM-L6-v2",
-            "normalized": True,
-            "generated_at": datetime.now(UTC).isoformat(),
-        },
-        "samples": [
-            {"id": i, "text": sentences[i], "embedding": embeddings[i].tolist()}
-            for i in range(len(embeddings))
-        ],
+    # Package metadata (small JSON sidecar next to the binary arrays)
+    metadata = {
+        "count": len(embeddings),
+        "dimensions": int(embeddings.shape[1]),
+        "dtype": str(embeddings.dtype),
+        "model": MODEL_NAME,
+        "backend": f"onnx-qint8-{QUANTIZATION}",
+        "normalized": True,
+        "generated_at": datetime.now(UTC).isoformat(),
     }
 
-    # Write to disk
-    output_path = Path("data/seed_embeddings.json")
+    # Write to disk: binary float32 arrays instead of stringified JSON floats
+    output_path = OUTPUT_PATH
     output_path.parent.mkdir(exist_ok=True)
 
     print(f"Saving embeddings to {output_path}...")
-    with open(output_path, "w") as f:
-        json.dump(data, f, indent=2)
+    np.savez_compressed(
+        output_path,
+        ids=np.arange(len(embeddings), dtype=np.uint32),
+        embeddings=embeddings,
+        texts=np.array(sentences),
+    )
+    with open(METADATA_PATH, "w") as f:
+        json.dump(metadata, f, indent=2)
 
     file_size_mb = output_path.stat().st_size / 1024 / 1024
 
@@ -104,12 +155,29 @@ def generate_embeddings(count: int = 1000) -> dict:
     print("Statistics:")
     print(f"  Embeddings: {len(embeddings)}")
     print(f"  Dimensions: {embeddings.shape[1]}")
-    print(f"  Normalized: {data['metadata']['normalized']}")
-    print(f"  File: {output_path}")
+    print(f"  Normalized: {metadata['normalized']}")
+    print(f"  File: {output_path} (+ {METADATA_PATH.name})")
     print(f"  Size: {file_size_mb:.2f} MB")
     print(f"{'=' * 60}\n")
 
-    return data["metadata"]
+    return metadata
+
+
+def load_embeddings(path: Path = OUTPUT_PATH) -> dict:
+    """
+    Load seed embeddings written by generate_embeddings.
+
+    Args:
+        path: Location of the .npz archive
+
+    Returns:
+        Dictionary with ids, embeddings and texts arrays plus metadata
+    """
+    with np.load(path) as archive:
+        data = {name: archive[name] for name in archive.files}
+    with open(path.with_suffix(".metadata.json")) as f:
+        data["metadata"] = json.load(f)
+    return data
 
 
 if __name__ == "__main__":
@@ -13,34 +13,92 @@ Stage 0-2 Implementation:
 - Request ID tracking for observability
 """
 
+import asyncio
+import base64
 import os
 import time
 import uuid
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from contextvars import ContextVar
 from datetime import datetime, UTC
-from typing import Dict, Any, List, Optional, Union
+from pathlib import Path
+from typing import Annotated, Any, Callable, Coroutine, Dict, List, Optional, Union
 from uuid import UUID
 
+import grpc  # type: ignore[import-untyped]
+import httpx
 from fastapi import FastAPI, HTTPException, status, Request
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from qdrant_client import QdrantClient
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from fastapi.routing import APIRoute
+import numpy as np
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, PlainValidator, WithJsonSchema
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.exceptions import UnexpectedResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 from prometheus_client import Counter
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from .logging_config import logger
-
-# Context variable for request ID (thread-safe)
-request_id_var: ContextVar[str] = ContextVar("request_id", default="")
+from .logging_config import logger, request_id_var
 
 # Configuration
 QDRANT_URL = os.getenv("QDRANT_URL", "http://localhost:6333")
+QDRANT_GRPC_PORT = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+# gRPC sends vectors as packed protobuf floats instead of JSON text
+QDRANT_PREFER_GRPC = os.getenv("QDRANT_PREFER_GRPC", "true").lower() == "true"
+# Keep-alive connections for REST calls (gRPC multiplexes over one channel)
+QDRANT_POOL_SIZE = int(os.getenv("QDRANT_POOL_SIZE", "100"))
+# Ping idle gRPC channels so a silently dropped connection (LB idle timeout,
+# NAT reset) is detected and re-dialled before the next burst hits it
+QDRANT_GRPC_OPTIONS = {
+    "grpc.keepalive_time_ms": 30_000,
+    "grpc.keepalive_timeout_ms": 10_000,
+    "grpc.keepalive_permit_without_calls": 1,
+    "grpc.http2.max_pings_without_data": 0,
+}
 COLLECTION_NAME = os.getenv("COLLECTION_NAME", "ai_memory")
 VECTOR_SIZE = int(os.getenv("VECTOR_SIZE", "384"))  # all-MiniLM-L6-v2 default
+# Points per concurrent Qdrant upsert call when fanning out a large request
+UPSERT_SUB_BATCH_SIZE = int(os.getenv("UPSERT_SUB_BATCH_SIZE", "64"))
+# Max sub-batches of one request in flight at once
+UPSERT_CONCURRENCY = int(os.getenv("UPSERT_CONCURRENCY", "8"))
+MAX_UPSERT_POINTS = 1000  # Per-request cap, shared by /upsert and /upsert_bin
+MAX_BATCH_QUERIES = 100  # Per-request cap for /query_batch
+HEALTH_CACHE_TTL = float(os.getenv("HEALTH_CACHE_TTL", "5"))  # Seconds
+# Opt-in /query response cache (entries, 0 disables). It lives in each worker
+# and only that worker's upserts clear it; other workers' writes (and writes
+# made directly in Qdrant) show up once QUERY_CACHE_TTL expires. Entries are
+# whole responses, so size it against memory as well as hit rate.
+QUERY_CACHE_SIZE = int(os.getenv("QUERY_CACHE_SIZE", "0"))
+QUERY_CACHE_TTL = float(os.getenv("QUERY_CACHE_TTL", "60"))  # Seconds
+COLLECTIONS_CACHE_TTL = float(os.getenv("COLLECTIONS_CACHE_TTL", "5"))  # Seconds
+# int8 scalar quantization of stored vectors (4x less RAM, faster HNSW
+# traversal); searches oversample and rescore with the original vectors.
+# Only applies when the collection is created.
+QUANTIZATION_ENABLED = os.getenv("QUANTIZATION_ENABLED", "false").lower() == "true"
+QUANTIZATION_OVERSAMPLING = float(os.getenv("QUANTIZATION_OVERSAMPLING", "2.0"))
+# HNSW and segment tuning; unset leaves Qdrant's defaults (m=16,
+# ef_construct=100, segments per CPU count). Index settings only apply when
+# the collection is created, HNSW_EF to every search.
+_hnsw_env = {
+    name: int(os.environ[name])
+    for name in ("HNSW_M", "HNSW_EF_CONSTRUCT", "HNSW_EF", "SEGMENT_NUMBER")
+    if os.environ.get(name)
+}
+HNSW_M = _hnsw_env.get("HNSW_M")
+HNSW_EF_CONSTRUCT = _hnsw_env.get("HNSW_EF_CONSTRUCT")
+HNSW_EF = _hnsw_env.get("HNSW_EF")
+SEGMENT_NUMBER = _hnsw_env.get("SEGMENT_NUMBER")
+# /bulk_upsert only reads .npy files from inside this directory
+BULK_DATA_DIR = Path(os.getenv("BULK_DATA_DIR", "data")).resolve()
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+# Swagger/ReDoc and the OpenAPI schema are off in production unless ENABLE_DOCS=true
+ENABLE_DOCS = (
+    os.getenv("ENABLE_DOCS", str(ENVIRONMENT != "production")).lower() == "true"
+)
 
 # Custom business metrics
 vectors_upserted_total = Counter(
@@ -61,21 +119,191 @@ query_results_total = Counter(
     ["collection"],
 )
 
+query_cache_lookups_total = Counter(
+    "query_cache_lookups_total",
+    "Total number of /query cache lookups by result (hit or miss)",
+    ["collection", "result"],
+)
+
+# COLLECTION_NAME is fixed per process, so resolve each labelled child once
+# instead of looking it up through .labels() on every request
+_upserted_counter = vectors_upserted_total.labels(collection=COLLECTION_NAME)
+_queried_counter = vectors_queried_total.labels(collection=COLLECTION_NAME)
+_results_counter = query_results_total.labels(collection=COLLECTION_NAME)
+_cache_hit_counter = query_cache_lookups_total.labels(
+    collection=COLLECTION_NAME, result="hit"
+)
+_cache_miss_counter = query_cache_lookups_total.labels(
+    collection=COLLECTION_NAME, result="miss"
+)
+
+
+# Static response fields, built once at import (only timestamps/status vary)
+_ROOT_INFO: Dict[str, Any] = {
+    "message": "AI Memory System API",
+    "status": "healthy",
+    "stage": "2",
+    "description": "Vector database operations with Qdrant",
+}
+
+_HEALTH_INFO: Dict[str, Any] = {
+    "service": "ai-memory-system",
+    "version": "0.1.0",
+    "dependencies": {
+        "fastapi": "0.119+",
+        "qdrant-client": "1.15+",
+        "uvicorn": "0.37+",
+        "prometheus": "enabled",
+    },
+}
+
+# /health body up to its dynamic fields, pre-encoded: '{"service":...,' so a
+# response is this prefix plus the encoded dynamic dict minus its '{'
+_HEALTH_PREFIX = orjson.dumps(_HEALTH_INFO)[:-1] + b","
+
+# / body up to its timestamp value: '{"message":...,"timestamp":'
+_ROOT_PREFIX = orjson.dumps(_ROOT_INFO)[:-1] + b',"timestamp":'
+
+
+# (epoch second, ISO 8601 text) of the last timestamp rendered
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+
+def utc_timestamp() -> str:
+    """
+    Current UTC time as ISO 8601 at second resolution.
+
+    The string is rebuilt at most once per second; calls within the same
+    second return the cached text instead of allocating a new datetime.
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    if second != _timestamp_cache[0]:
+        _timestamp_cache = (second, datetime.fromtimestamp(second, UTC).isoformat())
+    return _timestamp_cache[1]
+
+
+# Last /health result as (expires_at, client, status_code, rendered body).
+# Probes arriving within HEALTH_CACHE_TTL reuse it instead of calling Qdrant.
+_health_cache: Optional[tuple[float, Any, int, bytes]] = None
+
+# Recent /query responses, least recently used first:
+# (vector bytes, limit, score_threshold) -> (expires_at, result count, body).
+# Any write clears it and bumps the epoch, so a search that started before
+# the write can't store its (now stale) result afterwards.
+QueryCacheKey = tuple[bytes, int, Optional[float]]
+_query_cache: OrderedDict[QueryCacheKey, tuple[float, int, bytes]] = OrderedDict()
+_write_epoch = 0
+_query_cache_client: Any = None
+
+# Last /collections result as (expires_at, client, write epoch, response)
+_collections_cache: Optional[tuple[float, Any, int, Dict[str, Any]]] = None
+
+
+def invalidate_read_caches() -> None:
+    """Drop cached /query and /collections responses after a write."""
+    global _write_epoch
+    _query_cache.clear()
+    _write_epoch += 1
+
+
+def query_cache_get(key: QueryCacheKey) -> Optional[tuple[int, bytes]]:
+    """Return (result count, body) for an unexpired cached query, else None."""
+    global _query_cache_client
+    if _query_cache_client is not qdrant_client:
+        # A new client may point at different data
+        invalidate_read_caches()
+        _query_cache_client = qdrant_client
+        return None
+
+    entry = _query_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, count, body = entry
+    if time.monotonic() >= expires_at:
+        del _query_cache[key]
+        return None
+    _query_cache.move_to_end(key)
+    return count, body
+
+
+def query_cache_put(key: QueryCacheKey, epoch: int, count: int, body: bytes) -> None:
+    """Cache a /query response unless a write happened since `epoch`."""
+    if QUERY_CACHE_SIZE <= 0 or epoch != _write_epoch:
+        return
+    _query_cache[key] = (time.monotonic() + QUERY_CACHE_TTL, count, body)
+    _query_cache.move_to_end(key)
+    if len(_query_cache) > QUERY_CACHE_SIZE:
+        _query_cache.popitem(last=False)
+
+
+def parse_vector(value: Any) -> np.ndarray:
+    """
+    Coerce an input vector to a float32 array in one numpy conversion.
+
+    Accepts a list of numbers or a base64 string of little-endian float16
+    values (~4x smaller on the wire than JSON). Replaces per-element
+    validation of 384 Python floats with a single C loop plus a shape check.
+
+    Raises:
+        ValueError: If the value can't be converted or has the wrong shape
+    """
+    try:
+        if isinstance(value, str):
+            raw = base64.b64decode(value, validate=True)
+            vector = np.frombuffer(raw, dtype="<f2").astype(np.float32)
+        else:
+            vector = np.asarray(value, dtype=np.float32)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid vector: {e}") from e
+
+    if vector.shape != (VECTOR_SIZE,):
+        raise ValueError(
+            f"Vector must have {VECTOR_SIZE} dimensions, got shape {vector.shape}"
+        )
+    if not np.isfinite(vector).all():
+        raise ValueError("Vector must not contain NaN or infinite values")
+    return vector
+
+
+# float32 vector validated by parse_vector; documented as the JSON array it
+# arrives as (or its base64 float16 form)
+Vector = Annotated[
+    np.ndarray,
+    PlainValidator(parse_vector),
+    WithJsonSchema(
+        {
+            "anyOf": [
+                {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "minItems": VECTOR_SIZE,
+                    "maxItems": VECTOR_SIZE,
+                },
+                {"type": "string", "format": "base64"},
+            ]
+        }
+    ),
+]
+
 
 # Pydantic models for request/response validation
 class VectorPoint(BaseModel):
     """Single vector point for upsertion."""
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     id: Union[int, str, UUID] = Field(
         ...,
         description="Unique identifier (integer or UUID string)",
         examples=[1, "550e8400-e29b-41d4-a716-446655440000"],
     )
-    vector: List[float] = Field(
+    vector: Vector = Field(
         ...,
-        description="Dense vector embedding (384 dimensions)",
-        min_length=384,
-        max_length=384,
+        description=(
+            "Dense vector embedding (384 dimensions), as a list of floats or a "
+            "base64 string of little-endian float16 values"
+        ),
         examples=[[0.1] * 384],
     )
     payload: Optional[Dict[str, Any]] = Field(
@@ -91,7 +319,7 @@ class UpsertRequest(BaseModel):
     points: List[VectorPoint] = Field(
         ...,
         min_length=1,
-        max_length=1000,
+        max_length=MAX_UPSERT_POINTS,
         description="List of vectors to insert/update (1-1000 vectors per request)",
     )
 
@@ -123,14 +351,49 @@ class UpsertRequest(BaseModel):
     }
 
 
+class BulkUpsertRequest(BaseModel):
+    """Bulk ingestion request referencing a server-side .npy vector file."""
+
+    path: str = Field(
+        ...,
+        description="Path of a 2-D float .npy file (n x 384), relative to BULK_DATA_DIR",
+        examples=["bulk/vectors.npy"],
+    )
+    id_offset: int = Field(
+        default=0,
+        ge=0,
+        description="ID assigned to the first row; rows get consecutive IDs",
+    )
+    batch_size: int = Field(
+        default=32,
+        ge=1,
+        le=1000,
+        description="Points per upload request (1-1000)",
+    )
+    parallel: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Upload worker processes (1-16)",
+    )
+
+
 class QueryRequest(BaseModel):
     """Semantic search query model."""
 
-    vector: List[float] = Field(
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        json_schema_extra={
+            "examples": [{"vector": [0.15] * 384, "limit": 5, "score_threshold": 0.7}]
+        },
+    )
+
+    vector: Vector = Field(
         ...,
-        description="Query vector for similarity search (384 dimensions)",
-        min_length=384,
-        max_length=384,
+        description=(
+            "Query vector for similarity search (384 dimensions), as a list of "
+            "floats or a base64 string of little-endian float16 values"
+        ),
         examples=[[0.15] * 384],
     )
     limit: int = Field(
@@ -148,11 +411,16 @@ class QueryRequest(BaseModel):
         examples=[0.7],
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [{"vector": [0.15] * 384, "limit": 5, "score_threshold": 0.7}]
-        }
-    }
+
+class QueryBatchRequest(BaseModel):
+    """Several semantic search queries answered in one Qdrant round-trip."""
+
+    queries: List[QueryRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_QUERIES,
+        description="Queries to run (1-100), each with its own limit and threshold",
+    )
 
 
 class QueryResult(BaseModel):
@@ -163,8 +431,59 @@ class QueryResult(BaseModel):
     payload: Optional[Dict[str, Any]] = None
 
 
-# Global Qdrant client
-qdrant_client: Optional[QdrantClient] = None
+def collection_settings() -> Dict[str, Any]:
+    """create_collection arguments shared by startup and auto-recovery."""
+    settings: Dict[str, Any] = {
+        "vectors_config": models.VectorParams(
+            size=VECTOR_SIZE, distance=models.Distance.COSINE
+        )
+    }
+    if QUANTIZATION_ENABLED:
+        settings["quantization_config"] = models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8, quantile=0.99, always_ram=True
+            )
+        )
+    if HNSW_M is not None or HNSW_EF_CONSTRUCT is not None:
+        settings["hnsw_config"] = models.HnswConfigDiff(
+            m=HNSW_M, ef_construct=HNSW_EF_CONSTRUCT
+        )
+    if SEGMENT_NUMBER is not None:
+        settings["optimizers_config"] = models.OptimizersConfigDiff(
+            default_segment_number=SEGMENT_NUMBER
+        )
+    return settings
+
+
+def search_params() -> Optional[models.SearchParams]:
+    """Per-search parameters, or None to leave Qdrant's defaults in place."""
+    if not QUANTIZATION_ENABLED and HNSW_EF is None:
+        return None
+    quantization = (
+        models.QuantizationSearchParams(
+            rescore=True, oversampling=QUANTIZATION_OVERSAMPLING
+        )
+        if QUANTIZATION_ENABLED
+        else None
+    )
+    return models.SearchParams(hnsw_ef=HNSW_EF, quantization=quantization)
+
+
+# Built once: the settings are fixed for the life of the process
+SEARCH_PARAMS = search_params()
+
+
+# Global Qdrant client (async, so handlers never block the event loop)
+qdrant_client: Optional[AsyncQdrantClient] = None
+
+# Bumped each time auto-recovery recreates COLLECTION_NAME. Requests note it
+# before calling Qdrant, so ones that failed against the same (deleted)
+# collection share one recreation instead of each issuing create_collection.
+collection_generation = 0
+_collection_lock = asyncio.Lock()
+
+# Held while /health refreshes its cached probe result
+_health_lock = asyncio.Lock()
 
 
 @asynccontextmanager
@@ -177,6 +496,7 @@ async def lifespan(app: FastAPI):
         "Starting AI Memory System",
         extra={
             "qdrant_url": QDRANT_URL,
+            "prefer_grpc": QDRANT_PREFER_GRPC,
             "collection_name": COLLECTION_NAME,
             "vector_size": VECTOR_SIZE,
         },
@@ -184,10 +504,22 @@ async def lifespan(app: FastAPI):
 
     try:
         # Initialize Qdrant client with timeout for production resilience
-        qdrant_client = QdrantClient(url=QDRANT_URL, timeout=30)
+        # gRPC channel for data-plane calls; the keep-alive pool serves any
+        # calls that fall back to REST
+        qdrant_client = AsyncQdrantClient(
+            url=QDRANT_URL,
+            prefer_grpc=QDRANT_PREFER_GRPC,
+            grpc_port=QDRANT_GRPC_PORT,
+            grpc_options=dict(QDRANT_GRPC_OPTIONS),
+            timeout=30,
+            limits=httpx.Limits(
+                max_connections=QDRANT_POOL_SIZE,
+                max_keepalive_connections=QDRANT_POOL_SIZE,
+            ),
+        )
 
         # Test connection
-        collections = qdrant_client.get_collections()
+        collections = await qdrant_client.get_collections()
         logger.info(
             "Qdrant connection established",
             extra={"collections_count": len(collections.collections)},
@@ -195,7 +527,7 @@ async def lifespan(app: FastAPI):
 
         # Create collection if it doesn't exist
         try:
-            collection_info = qdrant_client.get_collection(COLLECTION_NAME)
+            collection_info = await qdrant_client.get_collection(COLLECTION_NAME)
             logger.info(
                 "Collection already exists",
                 extra={
@@ -210,13 +542,11 @@ async def lifespan(app: FastAPI):
                     "collection": COLLECTION_NAME,
                     "vector_size": VECTOR_SIZE,
                     "distance": "COSINE",
+                    "quantization": QUANTIZATION_ENABLED,
                 },
             )
-            qdrant_client.create_collection(
-                collection_name=COLLECTION_NAME,
-                vectors_config=models.VectorParams(
-                    size=VECTOR_SIZE, distance=models.Distance.COSINE
-                ),
+            await qdrant_client.create_collection(
+                collection_name=COLLECTION_NAME, **collection_settings()
             )
             logger.info(
                 "Collection created successfully", extra={"collection": COLLECTION_NAME}
@@ -244,7 +574,7 @@ async def lifespan(app: FastAPI):
     if qdrant_client:
         logger.info("Shutting down AI Memory System")
         try:
-            qdrant_client.close()
+            await qdrant_client.close()
             logger.info("Qdrant client closed")
         except Exception as e:
             logger.warning(
@@ -254,7 +584,7 @@ async def lifespan(app: FastAPI):
 
 
 # Helper function for collection auto-recovery
-def ensure_collection_exists(collection_name: str = COLLECTION_NAME) -> None:
+async def ensure_collection_exists(collection_name: str = COLLECTION_NAME) -> None:
     """
     Ensure collection exists by creating it (idempotent operation).
     
@@ -279,17 +609,15 @@ def ensure_collection_exists(collection_name: str = COLLECTION_NAME) -> None:
             "collection": collection_name,
             "vector_size": VECTOR_SIZE,
             "distance": "COSINE",
+            "quantization": QUANTIZATION_ENABLED,
         },
     )
     
     # Create collection - Qdrant handles "already exists" gracefully
     # by returning success without error
     try:
-        qdrant_client.create_collection(
-            collection_name=collection_name,
-            vectors_config=models.VectorParams(
-                size=VECTOR_SIZE, distance=models.Distance.COSINE
-            ),
+        await qdrant_client.create_collection(
+            collection_name=collection_name, **collection_settings()
         )
         logger.info(
             "Collection created/verified successfully",
@@ -304,6 +632,184 @@ def ensure_collection_exists(collection_name: str = COLLECTION_NAME) -> None:
         )
 
 
+async def recover_collection(failed_generation: int) -> None:
+    """
+    Recreate the collection after Qdrant reported it missing.
+
+    Args:
+        failed_generation: collection_generation read before the failed call.
+            If another request already recreated the collection since then,
+            there is nothing to do and the caller can retry immediately.
+    """
+    global collection_generation
+    async with _collection_lock:
+        if collection_generation == failed_generation:
+            await ensure_collection_exists(COLLECTION_NAME)
+            collection_generation += 1
+            invalidate_read_caches()
+
+
+# gRPC status codes mapped to the HTTP status Qdrant's REST API would return
+_GRPC_HTTP_STATUS = {
+    grpc.StatusCode.NOT_FOUND: 404,
+    grpc.StatusCode.INVALID_ARGUMENT: 400,
+    grpc.StatusCode.FAILED_PRECONDITION: 400,
+    grpc.StatusCode.OUT_OF_RANGE: 400,
+    grpc.StatusCode.ALREADY_EXISTS: 409,
+}
+
+
+def qdrant_error_status(error: Exception) -> Optional[int]:
+    """
+    HTTP status Qdrant reported for a failed call, or None if not a Qdrant error.
+
+    Works for both transports: REST raises UnexpectedResponse with the status
+    code, gRPC raises AioRpcError with a status code mapped via
+    _GRPC_HTTP_STATUS. Unmapped gRPC codes count as 500.
+    """
+    if isinstance(error, UnexpectedResponse):
+        return error.status_code
+    if isinstance(error, grpc.aio.AioRpcError):
+        return _GRPC_HTTP_STATUS.get(error.code(), 500)
+    return None
+
+
+def is_collection_missing(error: Exception) -> bool:
+    """True if Qdrant rejected the call because the collection doesn't exist."""
+    return qdrant_error_status(error) == 404
+
+
+def is_client_error(error: Exception) -> bool:
+    """True if Qdrant rejected the call's input (a 4xx-class error)."""
+    error_status = qdrant_error_status(error)
+    return error_status is not None and 400 <= error_status < 500
+
+
+async def upsert_batch(
+    ids: List[Union[int, str]],
+    vectors: np.ndarray,
+    payloads: Optional[List[Dict[str, Any]]] = None,
+) -> None:
+    """
+    Upsert points as concurrent column-oriented sub-batches.
+
+    Each sub-batch of UPSERT_SUB_BATCH_SIZE is a models.Batch (parallel id,
+    vector and payload lists) rather than one PointStruct per point, which
+    maps straight onto the repeated fields of the gRPC request.
+    Overlapping several smaller Qdrant calls finishes a large request sooner
+    than one serial call; at most UPSERT_CONCURRENCY of them run at once so a
+    single large request can't flood Qdrant. If one sub-batch fails the rest
+    are cancelled; upserts are idempotent, so a failed request can be
+    retried as a whole.
+    """
+    # Bound locally so the closure sees a non-None client (callers return 503
+    # before getting here when Qdrant isn't connected)
+    client = qdrant_client
+    if client is None:
+        raise RuntimeError("Qdrant client is not connected")
+    semaphore = asyncio.Semaphore(UPSERT_CONCURRENCY)
+
+    async def upsert_sub_batch(start: int) -> None:
+        end = start + UPSERT_SUB_BATCH_SIZE
+        async with semaphore:
+            await client.upsert(
+                collection_name=COLLECTION_NAME,
+                points=models.Batch(
+                    ids=ids[start:end],
+                    vectors=vectors[start:end].tolist(),
+                    payloads=payloads[start:end] if payloads is not None else None,
+                ),
+            )
+
+    try:
+        # TaskGroup cancels the remaining sub-batches as soon as one fails
+        async with asyncio.TaskGroup() as group:
+            for start in range(0, len(ids), UPSERT_SUB_BATCH_SIZE):
+                group.create_task(upsert_sub_batch(start))
+    except ExceptionGroup as errors:
+        # Callers classify a single Qdrant error, so surface the first one
+        raise errors.exceptions[0] from None
+    finally:
+        # Even a failed call may have written some sub-batches
+        invalidate_read_caches()
+
+
+def parse_packed_points(body: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Decode an /upsert_bin body into (ids, vectors) arrays without copying.
+
+    Layout (little-endian): uint32 point count n, then n uint64 ids, then
+    n x VECTOR_SIZE float32 vector components.
+
+    Raises:
+        ValueError: If the count is out of range, the length doesn't match or
+            a vector contains NaN/infinite values
+    """
+    if len(body) < 4:
+        raise ValueError("Body too short for point count header")
+    count = int(np.frombuffer(body, dtype="<u4", count=1)[0])
+    if not 1 <= count <= MAX_UPSERT_POINTS:
+        raise ValueError(f"Point count must be 1-{MAX_UPSERT_POINTS}, got {count}")
+
+    expected = 4 + count * 8 + count * VECTOR_SIZE * 4
+    if len(body) != expected:
+        raise ValueError(
+            f"Expected {expected} bytes for {count} points of {VECTOR_SIZE} "
+            f"dimensions, got {len(body)}"
+        )
+
+    ids = np.frombuffer(body, dtype="<u8", count=count, offset=4)
+    vectors = np.frombuffer(body, dtype="<f4", offset=4 + count * 8).reshape(
+        count, VECTOR_SIZE
+    )
+    if not np.isfinite(vectors).all():
+        raise ValueError("Vectors must not contain NaN or infinite values")
+    return ids, vectors
+
+
+def first_non_finite_row(vectors: np.ndarray, chunk_rows: int = 65536) -> Optional[int]:
+    """
+    Index of the first row holding NaN or inf, or None if every value is finite.
+
+    Scans chunk_rows rows at a time so a memory-mapped file larger than RAM is
+    checked without materializing more than one chunk's boolean mask.
+    """
+    for start in range(0, len(vectors), chunk_rows):
+        finite = np.isfinite(vectors[start : start + chunk_rows]).all(axis=1)
+        if not finite.all():
+            return start + int(np.argmin(finite))
+    return None
+
+
+class ORJSONRequest(Request):
+    """Request whose JSON body is decoded with orjson instead of json.loads."""
+
+    async def json(self) -> Any:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI
+        # still turns malformed bodies into 422 json_invalid errors
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Route that hands FastAPI an ORJSONRequest for body parsing.
+
+    A 1000-point /upsert body is ~4 MB of float text; orjson decodes it in
+    less than half the time of the stdlib parser, which otherwise dominates
+    the request's CPU time ahead of pydantic validation.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request) -> Response:
+            return await handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
 # Initialize FastAPI app with proper OpenAPI configuration
 app = FastAPI(
     title="AI Memory System",
@@ -313,8 +819,10 @@ app = FastAPI(
         "and comprehensive observability."
     ),
     version="0.1.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,  # orjson: faster encoding than stdlib json
+    docs_url="/docs" if ENABLE_DOCS else None,
+    redoc_url="/redoc" if ENABLE_DOCS else None,
+    openapi_url="/openapi.json" if ENABLE_DOCS else None,
     lifespan=lifespan,
     openapi_tags=[
         {
@@ -335,14 +843,21 @@ app = FastAPI(
         },
     ],
 )
+# Must be set before any route is registered
+app.router.route_class = ORJSONRoute
+
+# Setup Prometheus metrics. Scrapes of /metrics itself aren't recorded (the
+# scraper's own traffic is noise); /health stays in since the Grafana
+# "Requests by Endpoint" panel charts it.
+Instrumentator(excluded_handlers=["/metrics"]).instrument(app).expose(app)
 
-# Setup Prometheus metrics
-Instrumentator().instrument(app).expose(app)
+# Compress large JSON bodies (e.g. /query with big payloads); small responses
+# such as /health stay below minimum_size and skip the compression overhead
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 
 # Request ID Middleware for tracing
-@app.middleware("http")
-async def add_request_id_middleware(request: Request, call_next):
+class RequestIDMiddleware:
     """
     Add unique request ID to every request for tracing.
 
@@ -350,23 +865,39 @@ async def add_request_id_middleware(request: Request, call_next):
     - Response headers (X-Request-ID)
     - Context variable for logging
     - Request state for handler access
+
+    Written as plain ASGI rather than @app.middleware("http"): Starlette's
+    BaseHTTPMiddleware runs every request through an extra task group and
+    memory stream, which is a noticeable share of cheap endpoints like /health.
     """
-    # Generate unique request ID
-    req_id = str(uuid.uuid4())
 
-    # Set in context for logging
-    request_id_var.set(req_id)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    # Add to request state for handlers
-    request.state.request_id = req_id
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    # Process request
-    response = await call_next(request)
+        # Generate unique request ID
+        req_id = str(uuid.uuid4())
 
-    # Add to response headers
-    response.headers["X-Request-ID"] = req_id
+        # Set in context for logging
+        request_id_var.set(req_id)
 
-    return response
+        # Add to request state for handlers (request.state.request_id)
+        scope.setdefault("state", {})["request_id"] = req_id
+
+        async def send_with_request_id(message: Message) -> None:
+            # Add to response headers
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Request-ID", req_id)
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+app.add_middleware(RequestIDMiddleware)
 
 
 # Global Exception Handlers
@@ -383,7 +914,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
             "method": request.method,
         },
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": "Request failed",
@@ -407,7 +938,7 @@ async def general_exception_handler(request: Request, exc: Exception):
         },
         exc_info=True,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -423,21 +954,19 @@ async def general_exception_handler(request: Request, exc: Exception):
     tags=["Health"],
     summary="Service Information",
     response_description="Basic service information and status",
+    response_model=None,  # Returned as pre-rendered JSON
 )
-def read_root() -> Dict[str, Any]:
+async def read_root() -> Response:
     """
     Get basic service information.
 
     Returns service metadata, current stage, and timestamp.
     Use this endpoint for quick service verification.
     """
-    return {
-        "message": "AI Memory System API",
-        "status": "healthy",
-        "stage": "2",
-        "description": "Vector database operations with Qdrant",
-        "timestamp": datetime.now(UTC).isoformat(),
-    }
+    # Declared async: no blocking I/O, so skip the threadpool hop.
+    # Only the timestamp is encoded per request.
+    body = _ROOT_PREFIX + orjson.dumps(utc_timestamp()) + b"}"
+    return Response(body, media_type="application/json")
 
 
 @app.get(
@@ -445,13 +974,13 @@ def read_root() -> Dict[str, Any]:
     tags=["Health"],
     summary="Health Check",
     response_description="Detailed health status including dependencies",
-    response_model=None,  # Allow multiple response types (Dict or JSONResponse)
+    response_model=None,  # Returned as pre-rendered JSON (200 or 503)
     responses={
         200: {"description": "Service is healthy"},
         503: {"description": "Service is degraded or dependencies are unavailable"},
     },
 )
-def health_check() -> Union[Dict[str, Any], JSONResponse]:
+async def health_check() -> Response:
     """
     Comprehensive health check for service and dependencies.
 
@@ -466,14 +995,39 @@ def health_check() -> Union[Dict[str, Any], JSONResponse]:
     to verify service availability and dependency health.
 
     Returns HTTP 503 if critical dependencies (Qdrant) are unavailable.
+    Results are cached for HEALTH_CACHE_TTL seconds, so frequent probes
+    don't each cost a Qdrant round-trip. When the cache expires, concurrent
+    probes wait for a single refresh instead of each calling Qdrant.
     """
+    cached = cached_health()
+    if cached is None:
+        async with _health_lock:
+            # Another probe may have refreshed it while this one waited
+            cached = cached_health() or await refresh_health()
+    status_code, body = cached
+    return Response(body, status_code, media_type="application/json")
+
+
+def cached_health() -> Optional[tuple[int, bytes]]:
+    """Return (status_code, body) of the cached /health result if still fresh."""
+    if qdrant_client and _health_cache is not None:
+        expires_at, cached_client, status_code, body = _health_cache
+        if time.monotonic() < expires_at and cached_client is qdrant_client:
+            return status_code, body
+    return None
+
+
+async def refresh_health() -> tuple[int, bytes]:
+    """Probe Qdrant, render the /health body and cache it."""
+    global _health_cache
+
     qdrant_status = "disconnected"
     qdrant_info = None
     is_healthy = True
 
     if qdrant_client:
         try:
-            collections = qdrant_client.get_collections()
+            collections = await qdrant_client.get_collections()
             qdrant_status = "connected"
             qdrant_info = {
                 "collections_count": len(collections.collections),
@@ -485,25 +1039,28 @@ def health_check() -> Union[Dict[str, Any], JSONResponse]:
     else:
         is_healthy = False  # No Qdrant client means service is not functional
 
-    response_data = {
-        "status": "healthy" if is_healthy else "degraded",
-        "service": "ai-memory-system",
-        "version": "0.1.0",
-        "dependencies": {
-            "fastapi": "0.119+",
-            "qdrant-client": "1.15+",
-            "uvicorn": "0.37+",
-            "prometheus": "enabled",
-        },
-        "qdrant": {"status": qdrant_status, "info": qdrant_info},
-        "timestamp": datetime.now(UTC).isoformat(),
-    }
+    # Only the dynamic fields are encoded per refresh
+    body = (
+        _HEALTH_PREFIX
+        + orjson.dumps(
+            {
+                "status": "healthy" if is_healthy else "degraded",
+                "qdrant": {"status": qdrant_status, "info": qdrant_info},
+                "timestamp": utc_timestamp(),
+            }
+        )[1:]
+    )
 
     # Return 503 Service Unavailable if Qdrant is down
-    if not is_healthy:
-        return JSONResponse(status_code=503, content=response_data)
-
-    return response_data
+    status_code = 200 if is_healthy else 503
+    if qdrant_client:
+        _health_cache = (
+            time.monotonic() + HEALTH_CACHE_TTL,
+            qdrant_client,
+            status_code,
+            body,
+        )
+    return status_code, body
 
 
 @app.post(
@@ -512,8 +1069,9 @@ def health_check() -> Union[Dict[str, Any], JSONResponse]:
     tags=["Vector Operations"],
     summary="Store Vectors",
     response_description="Upsert operation result with performance metrics",
+    response_model=None,  # Returned as ORJSONResponse, no outbound validation
 )
-def upsert_vectors(request: UpsertRequest) -> Dict[str, Any]:
+async def upsert_vectors(request: UpsertRequest) -> ORJSONResponse:
     """
     Insert or update vectors in the collection (upsert operation).
 
@@ -545,29 +1103,31 @@ def upsert_vectors(request: UpsertRequest) -> Dict[str, Any]:
     )
 
     try:
-        # Convert Pydantic models to Qdrant points
-        points = [
-            models.PointStruct(
-                id=str(point.id) if isinstance(point.id, UUID) else point.id,
-                vector=point.vector,
-                payload=point.payload or {},
-            )
+        # Split points into parallel columns (struct-of-arrays for models.Batch)
+        ids = [
+            str(point.id) if isinstance(point.id, UUID) else point.id
             for point in request.points
         ]
+        vectors = np.stack([point.vector for point in request.points])
+        # Payload-less requests send no payload column at all; models.Batch
+        # rejects None entries, so mixed requests still fill gaps with {}
+        payloads: Optional[List[Dict[str, Any]]] = None
+        if any(point.payload for point in request.points):
+            payloads = [point.payload or {} for point in request.points]
 
         # Upsert to Qdrant with auto-recovery for missing collection
+        generation = collection_generation
         try:
-            qdrant_client.upsert(collection_name=COLLECTION_NAME, points=points)
+            await upsert_batch(ids, vectors, payloads)
         except Exception as e:
-            # Check if error is due to missing collection
-            if "doesn't exist" in str(e).lower() or "not found" in str(e).lower():
+            if is_collection_missing(e):
                 logger.warning(
                     "Collection missing during upsert, attempting auto-recovery",
                     extra={"collection": COLLECTION_NAME, "error": str(e)},
                 )
                 # Auto-create collection and retry
-                ensure_collection_exists(COLLECTION_NAME)
-                qdrant_client.upsert(collection_name=COLLECTION_NAME, points=points)
+                await recover_collection(generation)
+                await upsert_batch(ids, vectors, payloads)
             else:
                 # Re-raise if not a collection-missing error
                 raise
@@ -576,7 +1136,7 @@ def upsert_vectors(request: UpsertRequest) -> Dict[str, Any]:
         elapsed_ms = round(elapsed * 1000, 2)
 
         # Update business metrics
-        vectors_upserted_total.labels(collection=COLLECTION_NAME).inc(vector_count)
+        _upserted_counter.inc(vector_count)
 
         logger.info(
             "Upsert completed successfully",
@@ -590,12 +1150,14 @@ def upsert_vectors(request: UpsertRequest) -> Dict[str, Any]:
             },
         )
 
-        return {
-            "status": "success",
-            "collection": COLLECTION_NAME,
-            "upserted_count": len(points),
-            "elapsed_ms": elapsed_ms,
-        }
+        return ORJSONResponse(
+            {
+                "status": "success",
+                "collection": COLLECTION_NAME,
+                "upserted_count": vector_count,
+                "elapsed_ms": elapsed_ms,
+            }
+        )
 
     except Exception as e:
         error_msg = str(e)
@@ -612,46 +1174,298 @@ def upsert_vectors(request: UpsertRequest) -> Dict[str, Any]:
             },
         )
 
-        # Provide helpful error messages with context
-        if "dimension" in error_msg.lower():
+        # Qdrant rejected the input (4xx): report it as a client error
+        if is_client_error(e):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
-                    "error": "Vector dimension mismatch",
-                    "message": f"Expected {VECTOR_SIZE} dimensions, check your input vectors",
+                    "error": "Invalid vector data",
+                    "message": (
+                        f"Qdrant rejected the points: expected {VECTOR_SIZE} "
+                        "dimensions and integer (0-4294967295) or UUID string IDs"
+                    ),
+                    "qdrant_error": error_msg,
                     "collection": COLLECTION_NAME,
                     "vector_count": vector_count,
                 },
             )
-        elif "point id" in error_msg.lower():
+        else:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail={
-                    "error": "Invalid vector ID format",
-                    "message": "Use integers (0-4294967295) or UUID strings",
+                    "error": "Vector upsert failed",
+                    "message": error_msg,
                     "collection": COLLECTION_NAME,
+                    "vector_count": vector_count,
                 },
             )
-        else:
+
+
+@app.post(
+    "/upsert_bin",
+    status_code=status.HTTP_200_OK,
+    tags=["Vector Operations"],
+    summary="Store Packed Vectors",
+    response_description="Upsert operation result with performance metrics",
+    response_model=None,  # Returned as ORJSONResponse, no outbound validation
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/octet-stream": {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            },
+        }
+    },
+)
+async def upsert_vectors_binary(request: Request) -> ORJSONResponse:
+    """
+    Insert or update vectors sent as packed binary (no JSON, no payloads).
+
+    **Body** (`application/octet-stream`, little-endian):
+    - uint32: number of points n (1-1000)
+    - n x uint64: point IDs
+    - n x 384 x float32: vectors, row-major
+
+    Vectors are read straight from the request bytes with numpy, skipping
+    per-float JSON parsing and Pydantic validation. About 4x smaller on the
+    wire than the JSON `/upsert` body.
+
+    **Returns**: Same response shape as `/upsert`.
+    """
+    if not qdrant_client:
+        logger.error("Binary upsert request rejected - Qdrant not connected")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Vector database is not connected. Please try again later.",
+        )
+
+    start_time = time.perf_counter()
+
+    try:
+        ids, vectors = parse_packed_points(await request.body())
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "Invalid packed vector body", "message": str(e)},
+        )
+    vector_count = len(ids)
+    point_ids = ids.tolist()  # models.Batch takes a plain list of ids
+
+    generation = collection_generation
+    try:
+        try:
+            await upsert_batch(point_ids, vectors)
+        except Exception as e:
+            if is_collection_missing(e):
+                logger.warning(
+                    "Collection missing during upsert, attempting auto-recovery",
+                    extra={"collection": COLLECTION_NAME, "error": str(e)},
+                )
+                await recover_collection(generation)
+                await upsert_batch(point_ids, vectors)
+            else:
+                raise
+    except Exception as e:
+        logger.error(
+            "Binary upsert failed",
+            extra={
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "vector_count": vector_count,
+                "collection": COLLECTION_NAME,
+            },
+        )
+        if is_client_error(e):
             raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
-                    "error": "Vector upsert failed",
-                    "message": error_msg,
+                    "error": "Invalid vector data",
+                    "message": str(e),
                     "collection": COLLECTION_NAME,
                     "vector_count": vector_count,
                 },
             )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "Vector upsert failed",
+                "message": str(e),
+                "collection": COLLECTION_NAME,
+                "vector_count": vector_count,
+            },
+        )
+
+    elapsed_ms = round((time.perf_counter() - start_time) * 1000, 2)
+    _upserted_counter.inc(vector_count)
+    logger.info(
+        "Binary upsert completed successfully",
+        extra={
+            "vector_count": vector_count,
+            "collection": COLLECTION_NAME,
+            "elapsed_ms": elapsed_ms,
+        },
+    )
+
+    return ORJSONResponse(
+        {
+            "status": "success",
+            "collection": COLLECTION_NAME,
+            "upserted_count": vector_count,
+            "elapsed_ms": elapsed_ms,
+        }
+    )
+
+
+@app.post(
+    "/bulk_upsert",
+    status_code=status.HTTP_200_OK,
+    tags=["Vector Operations"],
+    summary="Bulk Load Vectors",
+    response_description="Upload result with performance metrics",
+    response_model=None,  # Returned as ORJSONResponse, no outbound validation
+)
+async def bulk_upsert_vectors(request: BulkUpsertRequest) -> ORJSONResponse:
+    """
+    Load a large vector file into the collection with parallel upload workers.
+
+    **Input**: A 2-D float `.npy` file (n x 384) under `BULK_DATA_DIR`. It is
+    memory-mapped, so files larger than RAM stream through without being
+    loaded up front. Rows get IDs `id_offset .. id_offset + n - 1` and no
+    payloads. Files containing NaN or inf are rejected before any upload.
+
+    **Operation**: qdrant-client's `upload_collection` splits the rows into
+    `batch_size` chunks and sends them from `parallel` worker processes, with
+    retries. It runs in a worker thread so the event loop stays responsive.
+
+    **Returns**: Success status, upserted count, and elapsed time in milliseconds.
+    """
+    if not qdrant_client:
+        logger.error("Bulk upsert request rejected - Qdrant not connected")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Vector database is not connected. Please try again later.",
+        )
+
+    path = (BULK_DATA_DIR / request.path).resolve()
+    if not path.is_relative_to(BULK_DATA_DIR) or path.suffix != ".npy":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "Invalid bulk file path",
+                "message": "Path must name a .npy file inside BULK_DATA_DIR",
+            },
+        )
+    try:
+        vectors = np.load(path, mmap_mode="r")
+    except (OSError, ValueError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": "Unreadable bulk file", "message": str(e)},
+        )
+    if vectors.ndim != 2 or vectors.shape[1] != VECTOR_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "Vector dimension mismatch",
+                "message": f"Expected shape (n, {VECTOR_SIZE}), got {vectors.shape}",
+            },
+        )
+    # Reads the whole file, so keep it off the event loop
+    bad_row = await asyncio.to_thread(first_non_finite_row, vectors)
+    if bad_row is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "error": "Invalid vector data",
+                "message": f"Row {bad_row} contains NaN or infinite values",
+            },
+        )
+
+    start_time = time.perf_counter()
+    vector_count = len(vectors)
+    logger.info(
+        "Bulk upsert started",
+        extra={
+            "vector_count": vector_count,
+            "file": str(path),
+            "batch_size": request.batch_size,
+            "parallel": request.parallel,
+            "collection": COLLECTION_NAME,
+        },
+    )
+
+    try:
+        await asyncio.to_thread(
+            qdrant_client.upload_collection,
+            collection_name=COLLECTION_NAME,
+            vectors=vectors,
+            ids=range(request.id_offset, request.id_offset + vector_count),
+            batch_size=request.batch_size,
+            parallel=request.parallel,
+            max_retries=3,
+            wait=True,
+        )
+    except Exception as e:
+        logger.error(
+            "Bulk upsert failed",
+            extra={
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "vector_count": vector_count,
+                "collection": COLLECTION_NAME,
+            },
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "Vector upsert failed",
+                "message": str(e),
+                "collection": COLLECTION_NAME,
+                "vector_count": vector_count,
+            },
+        )
+    finally:
+        # Even a failed upload may have written some batches
+        invalidate_read_caches()
+
+    elapsed = time.perf_counter() - start_time
+    elapsed_ms = round(elapsed * 1000, 2)
+    _upserted_counter.inc(vector_count)
+    logger.info(
+        "Bulk upsert completed successfully",
+        extra={
+            "vector_count": vector_count,
+            "collection": COLLECTION_NAME,
+            "elapsed_ms": elapsed_ms,
+            "throughput_vec_per_sec": round(vector_count / elapsed, 2)
+            if elapsed > 0
+            else 0,
+        },
+    )
+
+    return ORJSONResponse(
+        {
+            "status": "success",
+            "collection": COLLECTION_NAME,
+            "upserted_count": vector_count,
+            "elapsed_ms": elapsed_ms,
+        }
+    )
 
 
 @app.post(
     "/query",
-    response_model=List[QueryResult],
     tags=["Vector Operations"],
     summary="Semantic Search",
     response_description="List of similar vectors ranked by similarity score",
+    # Schema for the docs only: results are returned as pre-encoded orjson
+    # bytes, so FastAPI skips response-model validation and jsonable_encoder
+    response_model=None,
+    responses={200: {"model": List[QueryResult]}},
 )
-def query_vectors(request: QueryRequest) -> List[QueryResult]:
+async def query_vectors(request: QueryRequest) -> Response:
     """
     Find similar vectors using semantic similarity search.
 
@@ -668,7 +1482,10 @@ def query_vectors(request: QueryRequest) -> List[QueryResult]:
     - 0.5-0.79 = Moderately similar
     - < 0.5 = Low similarity
 
-    **Performance**: ~5ms p95 latency for 100K vectors
+    **Performance**: ~5ms p95 latency for 100K vectors. With QUERY_CACHE_SIZE
+    set, repeated queries (same vector, limit and threshold) are answered from
+    a per-worker cache for up to QUERY_CACHE_TTL seconds. Upserts clear only
+    the cache of the worker that handled them.
 
     **Returns**: Array of matching vectors with IDs, scores, and payloads.
     """
@@ -690,29 +1507,51 @@ def query_vectors(request: QueryRequest) -> List[QueryResult]:
         },
     )
 
+    cache_key = (
+        request.vector.tobytes(),
+        request.limit,
+        request.score_threshold,
+    )
+    cached = query_cache_get(cache_key) if QUERY_CACHE_SIZE > 0 else None
+    if cached is not None:
+        count, body = cached
+        _cache_hit_counter.inc()
+        _queried_counter.inc()
+        _results_counter.inc(count)
+        logger.info(
+            "Query served from cache",
+            extra={"results_count": count, "collection": COLLECTION_NAME},
+        )
+        return Response(body, media_type="application/json")
+    if QUERY_CACHE_SIZE > 0:
+        _cache_miss_counter.inc()
+    cache_epoch = _write_epoch
+
     try:
         # Query Qdrant with auto-recovery for missing collection
+        generation = collection_generation
         try:
-            search_result = qdrant_client.search(
+            search_result = await qdrant_client.search(
                 collection_name=COLLECTION_NAME,
                 query_vector=request.vector,
                 limit=request.limit,
                 score_threshold=request.score_threshold,
+                search_params=SEARCH_PARAMS,
             )
         except Exception as e:
-            # Check if error is due to missing collection
-            if "doesn't exist" in str(e).lower() or "not found" in str(e).lower():
+            if is_collection_missing(e):
                 logger.warning(
                     "Collection missing during query, attempting auto-recovery",
                     extra={"collection": COLLECTION_NAME, "error": str(e)},
                 )
                 # Auto-create collection and retry (will return empty results)
-                ensure_collection_exists(COLLECTION_NAME)
-                search_result = qdrant_client.search(
+                await recover_collection(generation)
+                search_result = await qdrant_client.search(
                     collection_name=COLLECTION_NAME,
                     query_vector=request.vector,
                     limit=request.limit,
                     score_threshold=request.score_threshold,
+                    search_params=SEARCH_PARAMS,
                 )
             else:
                 # Re-raise if not a collection-missing error
@@ -721,27 +1560,29 @@ def query_vectors(request: QueryRequest) -> List[QueryResult]:
         elapsed = time.perf_counter() - start_time
         elapsed_ms = round(elapsed * 1000, 2)
 
-        # Convert to response model
+        # Shape hits as QueryResult dicts (trusted Qdrant data, no validation)
         results = [
-            QueryResult(id=str(hit.id), score=hit.score, payload=hit.payload)
+            {"id": str(hit.id), "score": hit.score, "payload": hit.payload}
             for hit in search_result
         ]
 
         # Update business metrics
-        vectors_queried_total.labels(collection=COLLECTION_NAME).inc()
-        query_results_total.labels(collection=COLLECTION_NAME).inc(len(results))
+        _queried_counter.inc()
+        _results_counter.inc(len(results))
 
         logger.info(
             "Query completed successfully",
             extra={
                 "results_count": len(results),
                 "elapsed_ms": elapsed_ms,
-                "top_score": results[0].score if results else None,
+                "top_score": results[0]["score"] if results else None,
                 "collection": COLLECTION_NAME,
             },
         )
 
-        return results
+        body = orjson.dumps(results)
+        query_cache_put(cache_key, cache_epoch, len(results), body)
+        return Response(body, media_type="application/json")
 
     except Exception as e:
         error_msg = str(e)
@@ -758,12 +1599,17 @@ def query_vectors(request: QueryRequest) -> List[QueryResult]:
             },
         )
 
-        if "dimension" in error_msg.lower():
+        # Qdrant rejected the input (4xx): report it as a client error
+        if is_client_error(e):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail={
-                    "error": "Vector dimension mismatch",
-                    "message": f"Expected {VECTOR_SIZE} dimensions, check your query vector",
+                    "error": "Invalid query",
+                    "message": (
+                        f"Qdrant rejected the query: expected a {VECTOR_SIZE}-"
+                        "dimension vector"
+                    ),
+                    "qdrant_error": error_msg,
                     "collection": COLLECTION_NAME,
                 },
             )
@@ -779,35 +1625,171 @@ def query_vectors(request: QueryRequest) -> List[QueryResult]:
             )
 
 
+@app.post(
+    "/query_batch",
+    tags=["Vector Operations"],
+    summary="Batch Semantic Search",
+    response_description="One ranked result list per query, in request order",
+    response_model=None,  # Returned as pre-encoded orjson bytes
+    responses={200: {"model": List[List[QueryResult]]}},
+)
+async def query_vectors_batch(request: QueryBatchRequest) -> Response:
+    """
+    Run several similarity searches in a single Qdrant call.
+
+    Each query takes the same fields as `/query`. All of them go to Qdrant
+    as one batch search request, so N queries cost one round-trip instead
+    of N (useful for multi-query expansion in RAG pipelines). Results are
+    not served from or stored in the `/query` cache.
+
+    **Returns**: Array of result arrays, one per query, in request order.
+    """
+    if not qdrant_client:
+        logger.error("Batch query request rejected - Qdrant not connected")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Vector database is not connected. Please try again later.",
+        )
+
+    start_time = time.perf_counter()
+    query_count = len(request.queries)
+    logger.info(
+        "Batch query request received",
+        extra={"query_count": query_count, "collection": COLLECTION_NAME},
+    )
+
+    searches = [
+        models.SearchRequest(
+            vector=query.vector.tolist(),
+            limit=query.limit,
+            score_threshold=query.score_threshold,
+            params=SEARCH_PARAMS,
+            with_payload=True,
+        )
+        for query in request.queries
+    ]
+
+    generation = collection_generation
+    try:
+        try:
+            batch_result = await qdrant_client.search_batch(
+                collection_name=COLLECTION_NAME, requests=searches
+            )
+        except Exception as e:
+            if is_collection_missing(e):
+                logger.warning(
+                    "Collection missing during batch query, attempting auto-recovery",
+                    extra={"collection": COLLECTION_NAME, "error": str(e)},
+                )
+                await recover_collection(generation)
+                batch_result = await qdrant_client.search_batch(
+                    collection_name=COLLECTION_NAME, requests=searches
+                )
+            else:
+                raise
+    except Exception as e:
+        logger.error(
+            "Batch query failed",
+            extra={
+                "error": str(e),
+                "error_type": type(e).__name__,
+                "query_count": query_count,
+                "collection": COLLECTION_NAME,
+            },
+        )
+        if is_client_error(e):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail={
+                    "error": "Invalid query",
+                    "message": str(e),
+                    "collection": COLLECTION_NAME,
+                    "query_count": query_count,
+                },
+            )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "error": "Vector search failed",
+                "message": str(e),
+                "collection": COLLECTION_NAME,
+                "query_count": query_count,
+            },
+        )
+
+    results = [
+        [
+            {"id": str(hit.id), "score": hit.score, "payload": hit.payload}
+            for hit in hits
+        ]
+        for hits in batch_result
+    ]
+    results_count = sum(len(hits) for hits in results)
+
+    _queried_counter.inc(query_count)
+    _results_counter.inc(results_count)
+    logger.info(
+        "Batch query completed successfully",
+        extra={
+            "query_count": query_count,
+            "results_count": results_count,
+            "elapsed_ms": round((time.perf_counter() - start_time) * 1000, 2),
+            "collection": COLLECTION_NAME,
+        },
+    )
+
+    return Response(orjson.dumps(results), media_type="application/json")
+
+
 @app.get(
     "/collections",
     tags=["Collections"],
     summary="List Collections",
     response_description="Array of collections with metadata",
 )
-def list_collections() -> Dict[str, Any]:
+async def list_collections() -> Dict[str, Any]:
     """
     List all vector collections with statistics.
 
     Returns collection names and the number of vectors stored in each.
     Useful for monitoring storage usage and collection management.
 
-    **Returns**: Array of collection objects with name and vector count.
+    **Returns**: Array of collection objects with name and (approximate)
+    vector count. Results are cached for COLLECTIONS_CACHE_TTL seconds, or until the next
+    upsert through this worker.
     """
+    global _collections_cache
+
     if not qdrant_client:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Vector database is not connected. Please try again later.",
         )
 
+    now = time.monotonic()
+    if _collections_cache is not None:
+        expires_at, cached_client, epoch, result = _collections_cache
+        fresh = now < expires_at and epoch == _write_epoch
+        if fresh and cached_client is qdrant_client:
+            return result
+
+    epoch = _write_epoch
     try:
-        collections = qdrant_client.get_collections()
-        return {
+        collections = (await qdrant_client.get_collections()).collections
+        # Count every collection concurrently rather than one round-trip at a
+        # time. exact=False reads Qdrant's per-segment estimate instead of
+        # scanning every point, which is plenty for a monitoring view.
+        counts = await asyncio.gather(
+            *(qdrant_client.count(col.name, exact=False) for col in collections)
+        )
+        result = {
             "collections": [
-                {"name": col.name, "vectors_count": qdrant_client.count(col.name).count}
-                for col in collections.collections
+                {"name": col.name, "vectors_count": count.count}
+                for col, count in zip(collections, counts)
             ]
         }
+        _collections_cache = (now + COLLECTIONS_CACHE_TTL, qdrant_client, epoch, result)
+        return result
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -818,4 +1800,17 @@ def list_collections() -> Dict[str, Any]:
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools (from uvicorn[standard]) instead of asyncio + h11.
+    # Multiple workers need the app as an import string so each can load it;
+    # each builds its own Qdrant client in lifespan, so no sockets are shared
+    # across the fork. Default is one worker, like the Docker image: metrics
+    # and read caches are per process.
+    uvicorn.run(
+        "src.ai_memory_system.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=30,  # Reuse idle client connections between bursts
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
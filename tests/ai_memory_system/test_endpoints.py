@@ -8,15 +8,32 @@ Tests cover:
 - Error handling
 """
 
+import asyncio
+import base64
+import os
+import subprocess
+import sys
+from datetime import datetime, UTC
+
+import httpx
+import numpy as np
+import orjson
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+from qdrant_client.http.exceptions import UnexpectedResponse
 from qdrant_client.models import ScoredPoint
 
-from src.ai_memory_system.main import app
+from src.ai_memory_system.main import QDRANT_URL, app
 
+# Shared 384-dim vector for request bodies (only ever read, never mutated)
+VECTOR_384 = [0.1] * 384
+# Large bodies are pre-encoded with orjson; httpx's stdlib json= encoding of
+# hundreds of 384-float vectors is several times slower
+JSON_HEADERS = {"content-type": "application/json"}
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def client():
     """Test client fixture."""
     return TestClient(app)
@@ -25,7 +42,9 @@ def client():
 @pytest.fixture
 def mock_qdrant():
     """Mock Qdrant client for isolated tests."""
-    with patch("src.ai_memory_system.main.qdrant_client") as mock:
+    with patch(
+        "src.ai_memory_system.main.qdrant_client", new_callable=AsyncMock
+    ) as mock:
         yield mock
 
 
@@ -37,7 +56,7 @@ class TestUpsertEndpoint:
         mock_qdrant.upsert.return_value = Mock(status="completed")
 
         payload = {
-            "points": [{"id": 1, "vector": [0.1] * 384, "payload": {"test": True}}]
+            "points": [{"id": 1, "vector": VECTOR_384, "payload": {"test": True}}]
         }
 
         response = client.post("/upsert", json=payload)
@@ -55,17 +74,110 @@ class TestUpsertEndpoint:
 
         payload = {
             "points": [
-                {"id": i, "vector": [0.1] * 384, "payload": {"index": i}}
+                {"id": i, "vector": VECTOR_384, "payload": {"index": i}}
                 for i in range(100)
             ]
         }
 
-        response = client.post("/upsert", json=payload)
+        response = client.post(
+            "/upsert", content=orjson.dumps(payload), headers=JSON_HEADERS
+        )
 
         assert response.status_code == 200
         data = response.json()
         assert data["upserted_count"] == 100
 
+    def test_upsert_fans_out_sub_batches(self, client, mock_qdrant):
+        """Test large upserts are split into concurrent sub-batches."""
+        mock_qdrant.upsert.return_value = Mock(status="completed")
+
+        payload = {"points": [{"id": i, "vector": VECTOR_384} for i in range(150)]}
+
+        response = client.post(
+            "/upsert", content=orjson.dumps(payload), headers=JSON_HEADERS
+        )
+
+        assert response.status_code == 200
+        sizes = [len(c.kwargs["points"].ids) for c in mock_qdrant.upsert.call_args_list]
+        assert sizes == [64, 64, 22]
+
+    def test_upsert_bounds_sub_batch_concurrency(
+        self, client, mock_qdrant, monkeypatch
+    ):
+        """Test at most UPSERT_CONCURRENCY sub-batches are in flight at once."""
+        from src.ai_memory_system import main
+
+        monkeypatch.setattr(main, "UPSERT_SUB_BATCH_SIZE", 10)
+        monkeypatch.setattr(main, "UPSERT_CONCURRENCY", 2)
+        in_flight = peak = 0
+
+        async def slow_upsert(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        mock_qdrant.upsert.side_effect = slow_upsert
+
+        payload = {"points": [{"id": i, "vector": VECTOR_384} for i in range(50)]}
+        response = client.post("/upsert", json=payload)
+
+        assert response.status_code == 200
+        assert mock_qdrant.upsert.await_count == 5
+        assert peak == 2
+
+    def test_upsert_failed_sub_batch_cancels_the_rest(self, mock_qdrant, monkeypatch):
+        """Test one failing sub-batch cancels its siblings and re-raises as is."""
+        from src.ai_memory_system import main
+
+        monkeypatch.setattr(main, "UPSERT_SUB_BATCH_SIZE", 10)
+        monkeypatch.setattr(main, "UPSERT_CONCURRENCY", 2)
+        rejected = UnexpectedResponse(
+            status_code=400,
+            reason_phrase="Bad Request",
+            content=b"Unable to parse point id",
+            headers={},
+        )
+        completed = 0
+
+        async def upsert(**kwargs):
+            nonlocal completed
+            if kwargs["points"].ids[0] == 0:
+                raise rejected
+            await asyncio.sleep(0.01)
+            completed += 1
+
+        mock_qdrant.upsert.side_effect = upsert
+
+        async def upsert_then_settle():
+            with pytest.raises(UnexpectedResponse) as raised:
+                await main.upsert_batch(
+                    list(range(50)), np.zeros((50, 384), dtype=np.float32)
+                )
+            await asyncio.sleep(0.05)  # Let any orphaned sub-batch finish
+            return raised.value
+
+        assert asyncio.run(upsert_then_settle()) is rejected
+        assert completed == 0
+
+    def test_upsert_payloads_column(self, client, mock_qdrant):
+        """Test payload-less upserts omit payloads and mixed ones fill gaps."""
+        mock_qdrant.upsert.return_value = Mock(status="completed")
+
+        client.post("/upsert", json={"points": [{"id": 1, "vector": VECTOR_384}]})
+        assert mock_qdrant.upsert.call_args.kwargs["points"].payloads is None
+
+        payload = {
+            "points": [
+                {"id": 1, "vector": VECTOR_384},
+                {"id": 2, "vector": VECTOR_384, "payload": {"tag": "b"}},
+            ]
+        }
+        client.post("/upsert", json=payload)
+        batch = mock_qdrant.upsert.call_args.kwargs["points"]
+        assert batch.payloads == [{}, {"tag": "b"}]
+
     def test_upsert_with_uuid(self, client, mock_qdrant):
         """Test upsert with UUID identifier."""
         mock_qdrant.upsert.return_value = Mock(status="completed")
@@ -74,7 +186,7 @@ class TestUpsertEndpoint:
             "points": [
                 {
                     "id": "550e8400-e29b-41d4-a716-446655440000",
-                    "vector": [0.1] * 384,
+                    "vector": VECTOR_384,
                     "payload": {"type": "uuid"},
                 }
             ]
@@ -85,44 +197,84 @@ class TestUpsertEndpoint:
         assert response.status_code == 200
         assert response.json()["status"] == "success"
 
-    def test_upsert_empty_points_list(self, client):
-        """Test validation error with empty points list."""
-        payload = {"points": []}
-
-        response = client.post("/upsert", json=payload)
-
-        assert response.status_code == 422
-
-    def test_upsert_exceeds_max_batch(self, client):
-        """Test validation error when exceeding max batch size."""
+    def test_upsert_invalid_vector_dimension(self, client, mock_qdrant):
+        """Test vectors of the wrong dimension fail validation before Qdrant."""
         payload = {
             "points": [
-                {"id": i, "vector": [0.1] * 384}
-                for i in range(1001)  # Max is 1000
+                {"id": 1, "vector": [0.1] * 10}  # Wrong dimension
             ]
         }
 
         response = client.post("/upsert", json=payload)
 
         assert response.status_code == 422
+        mock_qdrant.upsert.assert_not_awaited()
 
-    def test_upsert_invalid_vector_dimension(self, client):
-        """Test validation with incorrect vector dimension."""
-        payload = {
-            "points": [
-                {"id": 1, "vector": [0.1] * 10}  # Wrong dimension
-            ]
-        }
+    def test_upsert_base64_float16_vector(self, client, mock_qdrant):
+        """Test upsert with a base64-packed float16 vector."""
+        mock_qdrant.upsert.return_value = Mock(status="completed")
+        vector = np.linspace(-1, 1, 384, dtype=np.float16)
+        packed = base64.b64encode(vector.astype("<f2").tobytes()).decode()
 
-        response = client.post("/upsert", json=payload)
+        response = client.post(
+            "/upsert", json={"points": [{"id": 1, "vector": packed}]}
+        )
+
+        assert response.status_code == 200
+        batch = mock_qdrant.upsert.call_args.kwargs["points"]
+        assert batch.vectors == [vector.tolist()]
 
-        # Could be 422 (validation), 500 (Qdrant error), or 503 (Qdrant unavailable)
-        assert response.status_code in [200, 422, 500, 503]
+    def test_upsert_invalid_base64_vector(self, client):
+        """Test validation of malformed or wrong-length packed vectors."""
+        short = base64.b64encode(np.zeros(10, dtype="<f2").tobytes()).decode()
+        nan = base64.b64encode(np.full(384, np.nan, dtype="<f2").tobytes()).decode()
+
+        for vector in ["not base64!", short, nan]:
+            response = client.post(
+                "/upsert", json={"points": [{"id": 1, "vector": vector}]}
+            )
+            assert response.status_code == 422
+
+    def test_upsert_non_numeric_vector(self, client, mock_qdrant):
+        """Test vectors that numpy can't convert are rejected with 422."""
+        for vector in [["x"] * 384, {"a": 1}, [VECTOR_384]]:
+            response = client.post(
+                "/upsert", json={"points": [{"id": 1, "vector": vector}]}
+            )
+            assert response.status_code == 422
+
+        mock_qdrant.upsert.assert_not_called()
+
+    def test_upsert_malformed_json(self, client, mock_qdrant):
+        """Test bodies orjson can't decode are rejected as json_invalid (422)."""
+        response = client.post(
+            "/upsert",
+            content=b'{"points": [{"id": 1, "vector": [0.1,',
+            headers={"Content-Type": "application/json"},
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["type"] == "json_invalid"
+        mock_qdrant.upsert.assert_not_called()
+
+    def test_upsert_qdrant_rejects_input(self, client, mock_qdrant):
+        """Test Qdrant 4xx errors map to 400 without inspecting the message."""
+        mock_qdrant.upsert.side_effect = UnexpectedResponse(
+            status_code=400,
+            reason_phrase="Bad Request",
+            content=b"Unable to parse point id",
+            headers={},
+        )
+
+        response = client.post(
+            "/upsert", json={"points": [{"id": "not-a-uuid", "vector": VECTOR_384}]}
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["error"] == "Invalid vector data"
 
     def test_upsert_qdrant_failure(self, client, mock_qdrant):
         """Test error handling when Qdrant fails."""
-        from qdrant_client.http.exceptions import UnexpectedResponse
-
         mock_qdrant.upsert.side_effect = UnexpectedResponse(
             status_code=500,
             reason_phrase="Internal Error",
@@ -130,7 +282,7 @@ class TestUpsertEndpoint:
             headers={},
         )
 
-        payload = {"points": [{"id": 1, "vector": [0.1] * 384}]}
+        payload = {"points": [{"id": 1, "vector": VECTOR_384}]}
 
         response = client.post("/upsert", json=payload)
 
@@ -142,6 +294,162 @@ class TestUpsertEndpoint:
         assert detail["error"] == "Vector upsert failed"
 
 
+def pack_points(ids, vectors):
+    """Encode points in the /upsert_bin wire format."""
+    return (
+        np.uint32(len(ids)).tobytes()
+        + np.asarray(ids, dtype="<u8").tobytes()
+        + np.asarray(vectors, dtype="<f4").tobytes()
+    )
+
+
+class TestRequestValidation:
+    """Requests rejected by model validation before any Qdrant call."""
+
+    @pytest.mark.parametrize(
+        "endpoint,payload",
+        [
+            ("/upsert", {"points": []}),
+            (
+                "/upsert",
+                {"points": [{"id": i, "vector": VECTOR_384} for i in range(1001)]},
+            ),
+            ("/query", {"vector": VECTOR_384, "limit": 0}),
+            ("/query", {"vector": [], "limit": 10}),
+        ],
+        ids=[
+            "upsert-empty",
+            "upsert-over-max-batch",
+            "query-limit-zero",
+            "query-empty-vector",
+        ],
+    )
+    def test_invalid_request_returns_422(self, client, mock_qdrant, endpoint, payload):
+        """Test malformed bodies are rejected with 422 and never reach Qdrant."""
+        response = client.post(
+            endpoint, content=orjson.dumps(payload), headers=JSON_HEADERS
+        )
+
+        assert response.status_code == 422
+        mock_qdrant.upsert.assert_not_called()
+        mock_qdrant.search.assert_not_called()
+
+
+class TestUpsertBinaryEndpoint:
+    """Test suite for /upsert_bin endpoint."""
+
+    def test_upsert_bin_success(self, client, mock_qdrant):
+        """Test packed float32 vectors are decoded and upserted."""
+        mock_qdrant.upsert.return_value = Mock(status="completed")
+        vectors = np.random.default_rng(0).random((3, 384), dtype=np.float32)
+
+        response = client.post(
+            "/upsert_bin",
+            content=pack_points([7, 8, 9], vectors),
+            headers={"content-type": "application/octet-stream"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["upserted_count"] == 3
+        batch = mock_qdrant.upsert.call_args.kwargs["points"]
+        assert batch.ids == [7, 8, 9]
+        assert np.array_equal(np.array(batch.vectors, dtype=np.float32), vectors)
+
+    def test_upsert_bin_length_mismatch(self, client, mock_qdrant):
+        """Test truncated bodies are rejected before reaching Qdrant."""
+        body = pack_points([1, 2], np.zeros((2, 384)))[:-4]
+
+        response = client.post("/upsert_bin", content=body)
+
+        assert response.status_code == 400
+        mock_qdrant.upsert.assert_not_called()
+
+    def test_upsert_bin_non_finite(self, client, mock_qdrant):
+        """Test NaN/inf components are rejected before reaching Qdrant."""
+        vectors = np.zeros((2, 384), dtype=np.float32)
+        vectors[1, 7] = np.inf
+
+        response = client.post("/upsert_bin", content=pack_points([1, 2], vectors))
+
+        assert response.status_code == 400
+        mock_qdrant.upsert.assert_not_called()
+
+    def test_upsert_bin_exceeds_max_batch(self, client, mock_qdrant):
+        """Test point count header is bounded like /upsert."""
+        body = pack_points(range(1001), np.zeros((1001, 384)))
+
+        response = client.post("/upsert_bin", content=body)
+
+        assert response.status_code == 400
+
+
+class TestBulkUpsertEndpoint:
+    """Test suite for /bulk_upsert endpoint."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path, monkeypatch):
+        """Point BULK_DATA_DIR at a temporary directory."""
+        monkeypatch.setattr("src.ai_memory_system.main.BULK_DATA_DIR", tmp_path)
+        return tmp_path
+
+    def test_bulk_upsert_success(self, client, mock_qdrant, data_dir):
+        """Test a memory-mapped .npy file is handed to upload_collection."""
+        mock_qdrant.upload_collection = Mock()
+        np.save(data_dir / "vectors.npy", np.zeros((5, 384), dtype=np.float32))
+
+        response = client.post(
+            "/bulk_upsert",
+            json={"path": "vectors.npy", "id_offset": 100, "parallel": 2},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["upserted_count"] == 5
+        kwargs = mock_qdrant.upload_collection.call_args.kwargs
+        assert isinstance(kwargs["vectors"], np.memmap)
+        assert list(kwargs["ids"]) == [100, 101, 102, 103, 104]
+        assert kwargs["parallel"] == 2
+
+    def test_bulk_upsert_rejects_path_outside_data_dir(
+        self, client, mock_qdrant, data_dir
+    ):
+        """Test paths escaping BULK_DATA_DIR are refused."""
+        mock_qdrant.upload_collection = Mock()
+
+        for path in ["../outside.npy", "/etc/passwd", "vectors.txt"]:
+            response = client.post("/bulk_upsert", json={"path": path})
+            assert response.status_code == 400
+
+        mock_qdrant.upload_collection.assert_not_called()
+
+    def test_bulk_upsert_wrong_dimension(self, client, mock_qdrant, data_dir):
+        """Test files with the wrong vector width are rejected."""
+        np.save(data_dir / "small.npy", np.zeros((5, 10), dtype=np.float32))
+
+        response = client.post("/bulk_upsert", json={"path": "small.npy"})
+
+        assert response.status_code == 400
+
+    def test_bulk_upsert_rejects_non_finite(self, client, mock_qdrant, data_dir):
+        """Test files with NaN or inf are rejected before anything is uploaded."""
+        from src.ai_memory_system import main
+
+        mock_qdrant.upload_collection = Mock()
+        vectors = np.zeros((10, 384), dtype=np.float32)
+        vectors[7, 3] = np.inf
+        np.save(data_dir / "bad.npy", vectors)
+
+        response = client.post("/bulk_upsert", json={"path": "bad.npy"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["message"].startswith("Row 7 ")
+        mock_qdrant.upload_collection.assert_not_called()
+        # Same row found when it sits past the first scan chunk
+        assert main.first_non_finite_row(vectors, chunk_rows=4) == 7
+        vectors[7, 3] = np.nan
+        assert main.first_non_finite_row(vectors, chunk_rows=4) == 7
+        assert main.first_non_finite_row(vectors[:7], chunk_rows=4) is None
+
+
 class TestQueryEndpoint:
     """Test suite for /query endpoint."""
 
@@ -153,7 +461,7 @@ class TestQueryEndpoint:
             )
         ]
 
-        payload = {"vector": [0.1] * 384, "limit": 10}
+        payload = {"vector": VECTOR_384, "limit": 10}
 
         response = client.post("/query", json=payload)
 
@@ -164,6 +472,25 @@ class TestQueryEndpoint:
         assert data[0]["score"] == 0.95
         assert data[0]["payload"] == {"text": "test"}
 
+    def test_query_large_response_is_gzipped(self, client, mock_qdrant):
+        """Test large query responses are gzip-compressed when accepted."""
+        mock_qdrant.search.return_value = [
+            ScoredPoint(
+                id=i, version=0, score=0.9, payload={"text": "x" * 50}, vector=None
+            )
+            for i in range(50)
+        ]
+
+        response = client.post(
+            "/query",
+            json={"vector": VECTOR_384, "limit": 50},
+            headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(response.json()) == 50
+
     def test_query_with_score_threshold(self, client, mock_qdrant):
         """Test query with score threshold filtering."""
         # Qdrant filters internally, so mock should return only above-threshold results
@@ -173,7 +500,7 @@ class TestQueryEndpoint:
             # Results below threshold not returned by Qdrant
         ]
 
-        payload = {"vector": [0.1] * 384, "limit": 10, "score_threshold": 0.8}
+        payload = {"vector": VECTOR_384, "limit": 10, "score_threshold": 0.8}
 
         response = client.post("/query", json=payload)
 
@@ -182,29 +509,53 @@ class TestQueryEndpoint:
         # All results should be >= threshold (Qdrant filters)
         assert all(item["score"] >= 0.8 for item in data)
 
-    def test_query_limit_validation(self, client):
-        """Test limit parameter validation."""
-        payload = {
-            "vector": [0.1] * 384,
-            "limit": 0,  # Invalid
-        }
+    def test_query_vector_parsed_like_upsert(self, client, mock_qdrant):
+        """Test query vectors share the upsert parsing: base64 ok, NaN rejected."""
+        mock_qdrant.search.return_value = []
+        vector = np.linspace(-1, 1, 384, dtype=np.float16)
+        packed = base64.b64encode(vector.astype("<f2").tobytes()).decode()
 
-        response = client.post("/query", json=payload)
+        response = client.post("/query", json={"vector": packed})
+        assert response.status_code == 200
+        sent = mock_qdrant.search.call_args.kwargs["query_vector"]
+        assert np.array_equal(sent, vector.astype(np.float32))
 
+        nan = base64.b64encode(np.full(384, np.nan, dtype="<f2").tobytes()).decode()
+        response = client.post("/query", json={"vector": nan})
         assert response.status_code == 422
 
-    def test_query_empty_vector(self, client):
-        """Test validation with empty vector."""
-        payload = {"vector": [], "limit": 10}
+    def test_query_cache_disabled_by_default(self, client, mock_qdrant):
+        """Test repeated queries reach Qdrant when QUERY_CACHE_SIZE is unset."""
+        mock_qdrant.search.return_value = []
+        payload = {"vector": [0.3] * 384, "limit": 3}
 
-        response = client.post("/query", json=payload)
+        client.post("/query", json=payload)
+        client.post("/query", json=payload)
+        assert mock_qdrant.search.await_count == 2
 
-        assert response.status_code == 422
+    def test_query_repeated_is_cached(self, client, mock_qdrant, monkeypatch):
+        """Test repeated queries are served from cache until an upsert."""
+        monkeypatch.setattr("src.ai_memory_system.main.QUERY_CACHE_SIZE", 100)
+        mock_qdrant.search.return_value = [
+            ScoredPoint(id=1, version=0, score=0.9, payload=None, vector=None)
+        ]
+        payload = {"vector": [0.2] * 384, "limit": 3}
+
+        first = client.post("/query", json=payload)
+        second = client.post("/query", json=payload)
+        assert first.json() == second.json()
+        assert mock_qdrant.search.await_count == 1
+
+        # A different limit is a different cache entry
+        client.post("/query", json={"vector": [0.2] * 384, "limit": 4})
+        assert mock_qdrant.search.await_count == 2
+
+        client.post("/upsert", json={"points": [{"id": 1, "vector": [0.2] * 384}]})
+        client.post("/query", json=payload)
+        assert mock_qdrant.search.await_count == 3
 
     def test_query_qdrant_failure(self, client, mock_qdrant):
         """Test error handling when Qdrant search fails."""
-        from qdrant_client.http.exceptions import UnexpectedResponse
-
         mock_qdrant.search.side_effect = UnexpectedResponse(
             status_code=500,
             reason_phrase="Internal Error",
@@ -212,7 +563,7 @@ class TestQueryEndpoint:
             headers={},
         )
 
-        payload = {"vector": [0.1] * 384, "limit": 10}
+        payload = {"vector": VECTOR_384, "limit": 10}
 
         response = client.post("/query", json=payload)
 
@@ -224,6 +575,43 @@ class TestQueryEndpoint:
         assert detail["error"] == "Vector search failed"
 
 
+class TestQueryBatchEndpoint:
+    """Test suite for /query_batch endpoint."""
+
+    def test_query_batch_success(self, client, mock_qdrant):
+        """Test several queries go to Qdrant as one batch search."""
+        mock_qdrant.search_batch.return_value = [
+            [ScoredPoint(id=1, version=0, score=0.9, payload={"a": 1}, vector=None)],
+            [],
+        ]
+
+        response = client.post(
+            "/query_batch",
+            json={
+                "queries": [
+                    {"vector": VECTOR_384, "limit": 3},
+                    {"vector": [0.2] * 384, "score_threshold": 0.5},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [[{"id": "1", "score": 0.9, "payload": {"a": 1}}], []]
+        requests = mock_qdrant.search_batch.call_args.kwargs["requests"]
+        assert [r.limit for r in requests] == [3, 10]
+        assert requests[1].score_threshold == 0.5
+        mock_qdrant.search_batch.assert_awaited_once()
+
+    def test_query_batch_validation(self, client, mock_qdrant):
+        """Test empty, oversized and malformed batches are rejected with 422."""
+        query = {"vector": VECTOR_384}
+        for queries in [[], [query] * 101, [{"vector": [0.1] * 10}]]:
+            response = client.post("/query_batch", json={"queries": queries})
+            assert response.status_code == 422
+
+        mock_qdrant.search_batch.assert_not_called()
+
+
 class TestCollectionsEndpoint:
     """Test suite for /collections endpoint."""
 
@@ -243,11 +631,25 @@ class TestCollectionsEndpoint:
         assert len(data["collections"]) == 1
         assert data["collections"][0]["name"] == "ai_memory"
         assert data["collections"][0]["vectors_count"] == 1000
+        mock_qdrant.count.assert_awaited_once_with("ai_memory", exact=False)
+
+    def test_collections_cached_until_upsert(self, client, mock_qdrant):
+        """Test repeated listings reuse the cached counts until a write."""
+        mock_collection = Mock()
+        mock_collection.name = "ai_memory"
+        mock_qdrant.get_collections.return_value = Mock(collections=[mock_collection])
+        mock_qdrant.count.return_value = Mock(count=1)
+
+        client.get("/collections")
+        client.get("/collections")
+        assert mock_qdrant.count.await_count == 1
+
+        client.post("/upsert", json={"points": [{"id": 1, "vector": VECTOR_384}]})
+        client.get("/collections")
+        assert mock_qdrant.count.await_count == 2
 
     def test_collections_qdrant_failure(self, client, mock_qdrant):
         """Test error handling when Qdrant fails to list collections."""
-        from qdrant_client.http.exceptions import UnexpectedResponse
-
         mock_qdrant.get_collections.side_effect = UnexpectedResponse(
             status_code=500,
             reason_phrase="Internal Error",
@@ -261,16 +663,30 @@ class TestCollectionsEndpoint:
         assert "failed" in response.json()["detail"].lower()
 
 
+@pytest.fixture(scope="session")
+def qdrant_available():
+    """Whether a Qdrant instance answers at QDRANT_URL (probed once)."""
+    try:
+        return httpx.get(f"{QDRANT_URL}/readyz", timeout=0.5).status_code == 200
+    except httpx.HTTPError:
+        return False
+
+
 class TestIntegration:
     """Integration tests (require running Qdrant instance)."""
 
+    @pytest.fixture
+    def live_client(self, qdrant_available):
+        """Client with lifespan run, so the app connects to the real Qdrant."""
+        if not qdrant_available:
+            pytest.skip("Qdrant not available for integration test")
+        with TestClient(app) as live:
+            yield live
+
     @pytest.mark.integration
-    def test_full_upsert_query_flow(self, client):
+    def test_full_upsert_query_flow(self, live_client):
         """Test complete flow: upsert then query."""
-        # Check if API is healthy first
-        health = client.get("/health")
-        if health.status_code != 200 or health.json().get("status") != "healthy":
-            pytest.skip("Qdrant not available for integration test")
+        client = live_client
 
         # Upsert vectors
         upsert_payload = {
@@ -328,6 +744,83 @@ class TestRootEndpoint:
         data = response.json()
         assert data["message"] == "AI Memory System API"
         assert data["status"] == "healthy"
-        assert "stage" in data
+        assert data["stage"] == "2"  # Stage 2: Production Observability complete
         assert "description" in data
         assert "timestamp" in data
+
+    def test_root_timestamp_is_utc_iso(self, client):
+        """Verify root timestamp is ISO 8601 UTC at second resolution."""
+        timestamp = datetime.fromisoformat(client.get("/").json()["timestamp"])
+
+        assert timestamp.tzinfo == UTC
+        assert timestamp.microsecond == 0
+        assert abs((datetime.now(UTC) - timestamp).total_seconds()) < 5
+
+    @pytest.mark.parametrize("url", ["/", "/health"])
+    def test_info_endpoints_return_json(self, client, mock_qdrant, url):
+        """Verify root and health endpoints use JSON content type."""
+        mock_qdrant.get_collections.return_value = Mock(collections=[])
+
+        response = client.get(url)
+
+        assert response.headers["content-type"] == "application/json"
+
+
+class TestHealthEndpoint:
+    """Test suite for /health endpoint."""
+
+    def test_health_endpoint(self, client, mock_qdrant):
+        """Verify health endpoint returns service status and dependencies."""
+        mock_qdrant.get_collections.return_value = Mock(collections=[])
+
+        response = client.get("/health")
+        assert response.status_code == 200
+
+        data = response.json()
+        assert data["status"] == "healthy"
+        assert data["service"] == "ai-memory-system"
+        assert data["version"] == "0.1.0"
+        assert "dependencies" in data
+        assert "fastapi" in data["dependencies"]
+        assert "qdrant-client" in data["dependencies"]
+        assert "qdrant" in data
+        assert "timestamp" in data
+
+
+class TestDocsEndpoints:
+    """Test suite for interactive API docs."""
+
+    @pytest.mark.parametrize(
+        ("env", "expected"),
+        [
+            ({"ENVIRONMENT": "development"}, 200),
+            ({"ENVIRONMENT": "production"}, 404),
+            ({"ENVIRONMENT": "production", "ENABLE_DOCS": "true"}, 200),
+        ],
+    )
+    def test_docs_endpoints_follow_enable_docs(self, env, expected):
+        """Verify /docs, /redoc and /openapi.json follow ENVIRONMENT/ENABLE_DOCS."""
+        # The docs routes are fixed when the app is built at import time, so
+        # import it fresh in a subprocess with the environment under test
+        script = (
+            "from fastapi.testclient import TestClient\n"
+            "from src.ai_memory_system.main import app\n"
+            "client = TestClient(app)\n"
+            "for url in ('/docs', '/redoc', '/openapi.json'):\n"
+            "    print(client.get(url).status_code)\n"
+        )
+        child_env = {
+            k: v
+            for k, v in os.environ.items()
+            if k not in ("ENVIRONMENT", "ENABLE_DOCS")
+        }
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            env={**child_env, **env},
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.split() == [str(expected)] * 3